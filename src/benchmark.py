@@ -0,0 +1,64 @@
+import os
+import time
+
+from compiler.automatonLALR1 import AutomatonLALR1
+from compiler.automatonLR1 import AutomatonLR1
+from compiler.parser import Parser
+from compiler.tableLR import TableLR
+from hulk.grammar import hulk_grammar
+from hulk.lexer import hulk_lexer_load
+from hulk.parser import hulk_to_grammar
+
+
+def benchmark_automaton(name: str, automaton_type, workers: int = 1) -> None:
+    a = automaton_type(f'bench_{name}', hulk_grammar, workers)
+    size = os.path.getsize(f'cache/bench_{name}_parse.bin')
+
+    print(f'{name}: ok {a.ok}, states {len(a.nodes)}, items {len(a.items)}, '
+          f'time {a.build_time:.2f}s, table {size} bytes')
+
+
+def count_reductions(tree) -> int:
+    count = 0
+    stack = [tree]
+
+    while len(stack) > 0:
+        node = stack.pop()
+
+        if not node.token.is_terminal:
+            count += 1
+            stack.extend(node.children)
+
+    return count
+
+
+def benchmark_parse(statements: int) -> None:
+    program = '\n'.join(
+        f'function f{i}(a, b) => a + b * {i} - (a @ "s" @@ b) ^ 2 + f(a, [x || x in range(0, {i})]);'
+        for i in range(statements)) + '\nprint(f0(1, 2));'
+
+    tokens = [hulk_to_grammar(t)
+              for t in hulk_lexer_load().run(program).tokens]
+
+    start = time.perf_counter()
+    t = TableLR(hulk_grammar)
+    t.load('hulk')
+    load = time.perf_counter() - start
+
+    p = Parser(hulk_grammar, t)
+
+    start = time.perf_counter()
+    result = p.parse(tokens)
+    elapsed = time.perf_counter() - start
+
+    print(f'parse: ok {result.ok}, tokens {len(tokens)}, load {load * 1000:.2f}ms, '
+          f'time {elapsed:.3f}s, {len(tokens) / elapsed:.0f} tokens/s, '
+          f'reductions {count_reductions(result.derivation_tree)}')
+
+
+benchmark_automaton('lr1', AutomatonLR1)
+benchmark_automaton('lalr1', AutomatonLALR1)
+# the parallel builder is opt-in, it is only worth comparing with several cores
+if (os.cpu_count() or 1) > 1:
+    benchmark_automaton('lr1_parallel', AutomatonLR1, os.cpu_count())
+benchmark_parse(500)
@@ -1,5 +1,10 @@
+import sys
+
 from hulk.interpreter import build
 from regex.regex_parser import regex_build
 
-print(f'regex build {regex_build()}')
-print(f'hulk build {build()}')
\ No newline at end of file
+# only the caches whose inputs changed are rebuilt, unless --force
+force = '--force' in sys.argv
+
+print(f'regex build {regex_build(force)}')
+print(f'hulk build {build(force)}')
\ No newline at end of file
@@ -1,5 +1,5 @@
-from typing import Generic, TypeVar, Dict, Callable, List, Tuple
-from .grammar import GrammarToken, EOF, Grammar
+from typing import Generic, TypeVar, Dict, Callable, List, Tuple, Set
+from .grammar import GrammarToken, GrammarProduction, EOF, Grammar
 from .parser_out import DerivationTree
 
 T1 = TypeVar('T1')
@@ -12,45 +12,116 @@ class AttributedRule(Generic[T1, T2]):
             i: action for i, action in actions}
         self.header_action: Callable[[
             List[T1], List[T1 | T2]], T1] = header_action
+        self.is_identity: bool = False
+
+
+class IdentityRule(AttributedRule[T1, T2]):
+    def __init__(self) -> None:
+        super().__init__(lambda _, s: s[1])
+        self.is_identity = True
+
+
+class PendingNode:
+    # a reduced production whose head receives an inherited attribute, it is
+    # evaluated once its parent computes that attribute
+    def __init__(self, production_ind: int, children: List) -> None:
+        self.production_ind: int = production_ind
+        self.children: List = children
 
 
 class AttributedGrammar(Generic[T1, T2], Grammar):
     def __init__(self) -> None:
         super().__init__()
         self.rules: List[AttributedRule] = []
+        self.inherited: Set[GrammarToken] | None = None
 
     def add_attributed_production(self, non_terminal: str, sentences: List[str], rules: List[AttributedRule]) -> None:
         super().add_production(non_terminal, sentences)
         self.rules += rules
+        self.inherited = None
 
-    def evaluate(self, derivation_tree: DerivationTree, tokens: List[T2]) -> T1:
-        tokens = tokens.copy()
-        tokens.reverse()
+    def get_inherited(self) -> Set[GrammarToken]:
+        # the symbols that receive an inherited attribute, computed once per
+        # set of productions
+        if self.inherited is None:
+            self.inherited = set()
 
-        return self.__evaluate(derivation_tree, tokens)
+            for production, rule in zip(self.productions, self.rules):
+                for i in rule.actions:
+                    self.inherited.add(production.body[i])
 
-    def __evaluate(self, node: DerivationTree, tokens: List[T2], inherit: T1 | None = None) -> T1:
-        def get_terminal() -> GrammarToken:
-            t = tokens[-1]
-            tokens.pop()
+        return self.inherited
 
-            return t
+    def is_transparent(self, production: GrammarProduction) -> bool:
+        # a unit production whose rule just forwards the value of its only
+        # child can be skipped by the parser without changing the result,
+        # as long as no inherited attribute reaches its head or its child
+        if super().is_transparent(production):
+            return True
 
-        h: List[None | T1] = [inherit] + \
-            [None for _ in range(len(node.children))]
-        s: List[None | T1 | T2] = [None] + \
-            [None for _ in range(len(node.children))]
+        if not self.rules[production.ind].is_identity or len(production.body) != 1:
+            return False
 
-        rule = self.rules[node.production_ind]
+        inherited = self.get_inherited()
+        child = production.body[0]
 
-        for i, n in enumerate(node.children):
-            if n.token.is_terminal:
-                s[i+1] = get_terminal()
-            else:
-                if i in rule.actions:
+        return not child.is_terminal and child not in inherited and \
+            production.head not in inherited
 
-                    h[i+1] = rule.actions[i](h, s)
+    def evaluate_production(self, production_ind: int, children: List, inherit: T1 | None = None) -> T1:
+        # evaluates a production from the values of its children, the pending
+        # ones are evaluated here with the attribute their action inherits
+        return self.__evaluate(production_ind, children, inherit, [])
 
-                s[i+1] = self.__evaluate(n, tokens, h[i+1])
+    def evaluate(self, derivation_tree: DerivationTree, tokens: List[T2]) -> T1:
+        return self.__evaluate(derivation_tree.production_ind, derivation_tree.children, None, tokens)
+
+    def __evaluate(self, production_ind: int, children: List, inherit: T1 | None, tokens: List[T2]) -> T1:
+        # depth first over an explicit stack of frames [production, children,
+        # h, s, next child], so deep trees do not reach the recursion limit.
+        # The children are derivation tree nodes, whose terminals take the
+        # next token, pending nodes, or already evaluated values
+        token_index = 0
+        stack = [[production_ind, children, [inherit] + [None] * len(children),
+                  [None] * (len(children) + 1), 0]]
+
+        while True:
+            frame = stack[-1]
+            ind, children, h, s, i = frame
+            rule = self.rules[ind]
+
+            if i == len(children):
+                value = rule.header_action(h, s)
+                stack.pop()
+
+                if len(stack) == 0:
+                    return value
+
+                frame = stack[-1]
+                frame[3][frame[4] + 1] = value
+                frame[4] += 1
+                continue
+
+            # terminals receive no inherited attribute
+            if i in rule.actions and not self.productions[ind].body[i].is_terminal:
+                h[i+1] = rule.actions[i](h, s)
+
+            child = children[i]
+
+            if isinstance(child, DerivationTree):
+                if child.token.is_terminal:
+                    s[i+1] = tokens[token_index]
+                    token_index += 1
+                    frame[4] += 1
+                    continue
+
+                ind, child = child.production_ind, child.children
+            elif isinstance(child, PendingNode):
+                ind, child = child.production_ind, child.children
+            else:
+                s[i+1] = child
+                frame[4] += 1
+                continue
 
-        return rule.header_action(h, s)
+            stack.append([ind, child, [h[i+1]] + [None] * len(child),
+                          [None] * (len(child) + 1), 0])
@@ -0,0 +1,39 @@
+from typing import Dict, FrozenSet, List
+
+from .automatonLR import Node
+from .automatonLR1 import AutomatonLR1
+from .itemLR import ItemLR
+
+
+class AutomatonLALR1(AutomatonLR1):
+    def _build_nodes(self):
+        super()._build_nodes()
+        self._merge_cores()
+
+    def _get_core(self, node: Node[ItemLR]) -> FrozenSet[int]:
+        return frozenset(item.ind for item in node.items)
+
+    def _merge_cores(self):
+        core_to_node: Dict[FrozenSet[int], Node[ItemLR]] = {}
+        old_to_new: List[Node[ItemLR]] = []
+        nodes: List[Node[ItemLR]] = []
+
+        for node in self.nodes:
+            core = self._get_core(node)
+
+            if core not in core_to_node:
+                core_to_node[core] = Node(len(nodes), {})
+                nodes.append(core_to_node[core])
+
+            merged = core_to_node[core]
+
+            for item, mask in node.items.items():
+                merged.items[item] = merged.items.get(item, 0) | mask
+
+            old_to_new.append(merged)
+
+        for node in self.nodes:
+            for t, i in node.transitions.items():
+                old_to_new[node.ind].add_transition(t, old_to_new[i])
+
+        self.nodes = nodes
@@ -1,18 +1,53 @@
+import multiprocessing
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from queue import Queue
 from typing import Generic, TypeVar
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Hashable
 
+from .fingerprint import fingerprint, source_fingerprint
 from .tableLR import NodeAction, Action, TableLR
-from .grammar import GrammarProduction, GrammarToken, Grammar, EOF
+from .grammar import GrammarProduction, GrammarToken, Grammar, EOF, LEFT, RIGHT
 
 T = TypeVar('T', bound='ItemLR')
 
+# automaton the pool workers expand states with, inherited through fork
+_worker_automaton: 'AutomatonLR | None' = None
+
+
+def _expand_nodes(nodes: List[Hashable], token_ids: List[int]) -> List[List[Tuple[int, Hashable]]]:
+    a = _worker_automaton
+    result = []
+
+    for encoded in nodes:
+        items = a._decode_items(encoded)
+        gotos = []
+
+        for i in token_ids:
+            goto = a._build_goto(items, a.grammar.get_symbol(i))
+
+            if len(goto) != 0:
+                gotos.append((i, a._encode_items(goto)))
+
+        result.append(gotos)
+
+    return result
+
+
+def partition(values: List, parts: int) -> List[List]:
+    if len(values) == 0:
+        return []
+
+    size = -(-len(values) // parts)
+
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
 
 class Node(Generic[T]):
-    def __init__(self, ind: int, items: Set[T]) -> None:
+    def __init__(self, ind: int, items: Set[T] | Dict[T, int]) -> None:
         self.ind: int = ind
-        self.items: Set[T] = items
+        self.items: Set[T] | Dict[T, int] = items
         self.transitions: Dict[GrammarToken, int] = {}
 
     def add_transition(self, token: GrammarToken, node: 'Node') -> None:
@@ -28,17 +63,37 @@ class Node(Generic[T]):
 
 
 class AutomatonLR(ABC, Generic[T]):
-    def __init__(self, name: str, grammar: Grammar):
+    def __init__(self, name: str, grammar: Grammar, workers: int = 1):
         self.grammar: Grammar = grammar
+        self.workers: int = workers
 
         self.items: List[T] = []
         self.nodes: List[Node] = []
+        self.node_keys: Dict[Hashable, Node] = {}
+        self.conflicts: List[str] = []
+
+        start = time.perf_counter()
 
         self._build_grammar()
         self._build_items()
         self._build_nodes()
 
         self.ok = self._build_table(name)
+        self.build_time: float = time.perf_counter() - start
+
+    @classmethod
+    def get_fingerprint(cls, grammar: Grammar) -> str:
+        # the table of an automaton depends on its grammar and on the code
+        # of the automaton classes and of the table builder
+        modules = [c.__module__ for c in cls.__mro__ if c.__module__.startswith(__package__)]
+        modules += [__name__, f'{__package__}.itemLR', TableLR.__module__,
+                    Grammar.__module__, type(grammar).__module__]
+
+        return fingerprint(cls.__name__, grammar.fingerprint(), source_fingerprint(modules))
+
+    @classmethod
+    def is_up_to_date(cls, name: str, grammar: Grammar) -> bool:
+        return TableLR.get_fingerprint(name) == cls.get_fingerprint(grammar)
 
     def nodes_to_str(self):
         s = ''
@@ -60,9 +115,13 @@ class AutomatonLR(ABC, Generic[T]):
     def _build_items(self):
         pass
 
+    def _get_node_key(self, items: Set[T]) -> Hashable:
+        return frozenset(item.ind for item in items)
+
     def _get_node(self, closure: Set[T]):
         node = Node(len(self.nodes), closure)
         self.nodes.append(node)
+        self.node_keys[self._get_node_key(closure)] = node
 
         return node
 
@@ -70,10 +129,27 @@ class AutomatonLR(ABC, Generic[T]):
     def _get_item_main(self) -> T:
         pass
 
-    def _build_nodes(self):
-        item_main = self._get_item_main()
+    def _get_items_main(self) -> Set[T]:
+        return set([self._get_item_main()])
+
+    def _encode_items(self, items: Set[T]) -> Hashable:
+        return tuple((item.production.ind, item.index) for item in items)
 
-        items_main = set([item_main])
+    def _decode_items(self, encoded: Hashable) -> Set[T]:
+        return set(self._get_item(self.grammar.get_production(p), i) for p, i in encoded)
+
+    def _build_nodes(self):
+        # the serial builder is the default. The process pool is opt-in
+        # (workers > 1): merging, decoding and deduplicating the states stays
+        # serial in this process, so it only pays off with several cores and
+        # large automata, and it is slower on a single core. A grammar with no
+        # symbol besides EOF has nothing to split among the workers
+        if self.workers > 1 and 'fork' in multiprocessing.get_all_start_methods() and \
+                any(t != EOF() for t in self.grammar.get_tokens()):
+            self._build_nodes_parallel()
+            return
+
+        items_main = self._get_items_main()
         self._build_closure(items_main)
         node = self._get_node(items_main)
 
@@ -98,6 +174,58 @@ class AutomatonLR(ABC, Generic[T]):
                 if to_add:
                     q.put(node_goto)
 
+    def _build_nodes_parallel(self):
+        # the states are expanded a whole BFS level at a time: the workers
+        # compute the gotos of a chunk of states over a part of the symbols,
+        # and the results are merged in state and symbol order, so the states
+        # get the same numbering as with the serial builder
+        global _worker_automaton
+
+        items_main = self._get_items_main()
+        self._build_closure(items_main)
+        frontier = [self._get_node(items_main)]
+
+        token_ids = [t.id for t in self.grammar.get_tokens() if t != EOF()]
+        token_parts = partition(token_ids, self.workers)
+
+        _worker_automaton = self
+
+        try:
+            with ProcessPoolExecutor(self.workers, multiprocessing.get_context('fork')) as pool:
+                while len(frontier) != 0:
+                    node_parts = partition(frontier, self.workers)
+                    encoded = [[self._encode_items(node.items) for node in part]
+                               for part in node_parts]
+
+                    futures = [[pool.submit(_expand_nodes, nodes, tokens) for tokens in token_parts]
+                               for nodes in encoded]
+
+                    gotos: List[Dict[int, Hashable]] = []
+
+                    for nodes, part in zip(encoded, futures):
+                        results = [f.result() for f in part]
+
+                        for j in range(len(nodes)):
+                            gotos.append(dict(g for r in results for g in r[j]))
+
+                    next_frontier = []
+
+                    for node, node_gotos in zip(frontier, gotos):
+                        for i in token_ids:
+                            if i not in node_gotos:
+                                continue
+
+                            goto = self._decode_items(node_gotos[i])
+                            node_goto, to_add = self._get_goto_node(goto)
+                            node.add_transition(self.grammar.get_symbol(i), node_goto)
+
+                            if to_add:
+                                next_frontier.append(node_goto)
+
+                    frontier = next_frontier
+        finally:
+            _worker_automaton = None
+
     def _build_closure(self, items: Set[T]):
         q = Queue()
 
@@ -129,32 +257,90 @@ class AutomatonLR(ABC, Generic[T]):
         return goto
 
     def _get_goto_node(self, items: Set[T]) -> Tuple[Node, bool]:
-        for node in self.nodes:
-            if all(item in node.items for item in items) and len(node.items) == len(items):
-                return node, False
+        key = self._get_node_key(items)
+
+        if key in self.node_keys:
+            return self.node_keys[key], False
 
         return self._get_node(items), True
 
     def _build_table(self, name: str) -> bool:
         node_actions = []
-        result = True
 
         for node in self.nodes:
             node_action = NodeAction(node.ind)
 
-            result = self._build_shift(node, node_action, result)
-            result = self._build_reduce(node, node_action, result)
-
-            if not result:
-                break
+            self._build_shift(node, node_action, True)
+            self._build_reduce(node, node_action, True)
+            self._resolve_conflicts(node_action)
 
             node_actions.append(node_action)
 
+        result = len(self.conflicts) == 0
+
         if result:
-            TableLR.build(name, node_actions)
+            TableLR.build(name, node_actions, self.grammar,
+                          self.get_fingerprint(self.grammar))
 
         return result
 
+    def _resolve_conflicts(self, node_action: NodeAction):
+        for token, actions in node_action.conflicts.items():
+            action = self._resolve_conflict(token, actions)
+
+            if action is None:
+                self.conflicts.append(
+                    self._conflict_to_str(node_action.ind, token, actions))
+            else:
+                node_action.terminal_actions[token] = action
+
+    def _resolve_conflict(self, token: GrammarToken, actions: List[Tuple[Action, int]]) -> Tuple[Action, int] | None:
+        # shift/reduce conflicts are settled by the precedence of the token
+        # against the one of the production, like yacc does
+        shifts = [a for a in actions if a[0] == Action.SHIFT]
+        reduces = [a for a in actions if a[0] == Action.REDUCE]
+
+        if len(shifts) != 1 or len(reduces) != 1 or len(actions) != 2:
+            return None
+
+        token_precedence = self.grammar.get_token_precedence(token)
+        production_precedence = self.grammar.get_production_precedence(
+            self.grammar.get_production(reduces[0][1]))
+
+        if token_precedence is None or production_precedence is None:
+            return None
+
+        token_level, associativity = token_precedence
+        production_level, _ = production_precedence
+
+        if production_level > token_level:
+            return reduces[0]
+
+        if production_level < token_level:
+            return shifts[0]
+
+        if associativity == LEFT:
+            return reduces[0]
+
+        if associativity == RIGHT:
+            return shifts[0]
+
+        return Action.ERROR, -1
+
+    def _conflict_to_str(self, ind: int, token: GrammarToken, actions: List[Tuple[Action, int]]) -> str:
+        descriptions = []
+
+        for action, i in actions:
+            if action == Action.SHIFT:
+                descriptions.append(f'shift to {i}')
+            elif action == Action.REDUCE:
+                descriptions.append(
+                    f'reduce {str(self.grammar.get_production(i)).strip()}')
+            else:
+                descriptions.append('accept')
+
+        return f'state {ind} on {token}: {", ".join(descriptions)}'
+
     def _build_shift(self, node: Node, node_action: NodeAction, result: bool):
         for t, i in node.transitions.items():
             if t.is_terminal:
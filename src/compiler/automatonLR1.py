@@ -1,81 +1,109 @@
-from typing import Dict, List, Tuple
+from typing import Dict, Hashable, List, Tuple
 
 from .automatonLR import AutomatonLR
 from .automatonLR import Node
 from .grammar import GrammarProduction, GrammarToken, Grammar, EOF
-from .itemLR import ItemLR1
+from .itemLR import ItemLR
 from .tableLR import NodeAction, Action
 
 
-class AutomatonLR1(AutomatonLR[ItemLR1]):
-    def __init__(self, name: str, grammar: Grammar):
-        super().__init__(name, grammar)
+class AutomatonLR1(AutomatonLR[ItemLR]):
+    # each node maps the core (production, index) of its items to a bitmask
+    # of lookaheads over the grammar symbol ids
+
+    def __init__(self, name: str, grammar: Grammar, workers: int = 1):
+        self.item_table: Dict[Tuple[int, int], ItemLR] = {}
+        self.head_to_productions: Dict[GrammarToken, List[GrammarProduction]] = {}
+
+        super().__init__(name, grammar, workers)
 
     def _build_grammar(self):
         self.grammar.calculate_first()
 
-    def _get_item(self, production: GrammarProduction, index: int, teal: GrammarToken) -> ItemLR1:
-        item = ItemLR1(len(self.items), production, index, teal)
-        self.items.append(item)
+    def _get_item(self, production: GrammarProduction, index: int) -> ItemLR:
+        key = (production.ind, index)
 
-        return item
+        if key not in self.item_table:
+            item = ItemLR(len(self.items), production, index)
+            self.items.append(item)
+            self.item_table[key] = item
 
-    def _get_item_main(self) -> ItemLR1:
-        return [
-            item for item in self.items if
-            item.production.head == self.grammar.main and item.index == 0 and item.teal == EOF()][0]
+        return self.item_table[key]
 
-    def _build_items(self):
-        head_to_item: Dict[GrammarToken, List[ItemLR1]] = {}
-        teal_production_to_item: Dict[Tuple[GrammarProduction,
-        GrammarToken], List[ItemLR1]] = {}
+    def _get_item_main(self) -> ItemLR:
+        production = [
+            p for p in self.grammar.productions if p.head == self.grammar.main][0]
 
-        for t in self.grammar.non_terminals:
-            head_to_item[t] = []
+        return self._get_item(production, 0)
 
-        for t in self.grammar.terminals:
-            for p in self.grammar.productions:
-                teal_production_to_item[(p, t)] = []
+    def _build_items(self):
+        # core items are created on demand from the kernel of each state, so
+        # only the productions of each non terminal are indexed here
+        for t in self.grammar.non_terminals:
+            self.head_to_productions[t] = []
 
         for production in self.grammar.productions:
-            for i in range(len(production.body) + 1):
-                for t in self.grammar.terminals:
-                    item = self._get_item(production, i, t)
+            self.head_to_productions[production.head].append(production)
 
-                    head_to_item[production.head].append(item)
-                    teal_production_to_item[(production, t)].append(item)
+    def _get_items_main(self) -> Dict[ItemLR, int]:
+        return {self._get_item_main(): self.grammar.get_mask([EOF()])}
 
-        for x in self.items:
-            if x.index == len(x.production.body) or x.production.body[x.index].is_terminal:
-                continue
+    def _build_closure(self, items: Dict[ItemLR, int]):
+        q = list(items)
 
-            for y in head_to_item[x.production.body[x.index]]:
-                if y.index == 0:
-                    w = self.grammar.calculate_sentence_first(
-                        x.production.body[x.index + 1:] + [x.teal])
-                    if y.teal in w:
-                        x.add_eof_transition(y)
+        while len(q) != 0:
+            item = q.pop()
+            body = item.production.body
 
-        for x in self.items:
-            if x.index == len(x.production.body):
+            if item.index == len(body) or body[item.index].is_terminal:
                 continue
 
-            for y in teal_production_to_item[(x.production, x.teal)]:
-                if y.index == x.index + 1:
-                    x.add_transition(
-                        x.production.body[x.index], y)
+            firsts, nullable = self.grammar.get_suffix_first(
+                item.production, item.index + 1)
+            teals = firsts | items[item] if nullable else firsts
+
+            for production in self.head_to_productions[body[item.index]]:
+                item_c = self._get_item(production, 0)
+                mask = items.get(item_c, 0)
+
+                if mask | teals == mask:
+                    continue
+
+                items[item_c] = mask | teals
+                q.append(item_c)
+
+    def _build_goto(self, items: Dict[ItemLR, int], token: GrammarToken) -> Dict[ItemLR, int]:
+        goto = {}
+
+        for item, mask in items.items():
+            body = item.production.body
+
+            if item.index < len(body) and body[item.index] == token:
+                goto[self._get_item(item.production, item.index + 1)] = mask
+
+        self._build_closure(goto)
+
+        return goto
+
+    def _encode_items(self, items: Dict[ItemLR, int]) -> Hashable:
+        return tuple((item.production.ind, item.index, mask) for item, mask in items.items())
+
+    def _decode_items(self, encoded: Hashable) -> Dict[ItemLR, int]:
+        return {self._get_item(self.grammar.get_production(p), i): mask for p, i, mask in encoded}
+
+    def _get_node_key(self, items: Dict[ItemLR, int]) -> Hashable:
+        return frozenset((item.ind, mask) for item, mask in items.items())
 
-    def _build_reduce(self, node: Node[ItemLR1], node_action: NodeAction, result: bool) -> bool:
-        for item in node.items:
+    def _build_reduce(self, node: Node[ItemLR], node_action: NodeAction, result: bool) -> bool:
+        for item, mask in node.items.items():
             if item.index == len(item.production.body):
                 if item.production.head == self.grammar.main:
-                    result = result and node_action.add_terminal_action(
-                        EOF(), Action.ACCEPT, -1)
+                    result = node_action.add_terminal_action(
+                        EOF(), Action.ACCEPT, -1) and result
 
                 else:
-                    result = result and node_action.add_terminal_action(
-                        item.teal, Action.REDUCE, item.production.ind)
-            if not result:
-                break
+                    for teal in self.grammar.get_mask_tokens(mask):
+                        result = node_action.add_terminal_action(
+                            teal, Action.REDUCE, item.production.ind) and result
 
         return result
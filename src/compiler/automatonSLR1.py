@@ -2,21 +2,27 @@ from .automatonLR import Node,AutomatonLR
 from .grammar import GrammarProduction, GrammarToken, Grammar, EOF
 from .tableLR import NodeAction, Action
 from .itemLR import ItemLR
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class AutomatonSLR1(AutomatonLR[ItemLR]):
-    def __init__(self, name: str, grammar: Grammar):
-        super().__init__(name, grammar)
+    def __init__(self, name: str, grammar: Grammar, workers: int = 1):
+        self.item_table: Dict[Tuple[int, int], ItemLR] = {}
+
+        super().__init__(name, grammar, workers)
 
     def _build_grammar(self):
         self.grammar.calculate_follow()
 
     def _get_item(self, production: GrammarProduction, index: int) -> ItemLR:
-        item = ItemLR(len(self.items), production, index)
-        self.items.append(item)
+        key = (production.ind, index)
+
+        if key not in self.item_table:
+            item = ItemLR(len(self.items), production, index)
+            self.items.append(item)
+            self.item_table[key] = item
 
-        return item
+        return self.item_table[key]
 
     def _build_items(self):
         head_to_item: Dict[GrammarToken, List[GrammarToken]] = {}
@@ -59,14 +65,11 @@ class AutomatonSLR1(AutomatonLR[ItemLR]):
         for item in node.items:
             if item.index == len(item.production.body):
                 if item.production.head == self.grammar.main:
-                    result = result and node_action.add_terminal_action(
-                        EOF(), Action.ACCEPT, -1)
+                    result = node_action.add_terminal_action(
+                        EOF(), Action.ACCEPT, -1) and result
                 else:
                     for t in self.grammar.follows[item.production.head]:
-                        result = result and node_action.add_terminal_action(
-                            t, Action.REDUCE, item.production.ind)
-
-            if not result:
-                break
+                        result = node_action.add_terminal_action(
+                            t, Action.REDUCE, item.production.ind) and result
 
         return result
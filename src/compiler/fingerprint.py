@@ -0,0 +1,27 @@
+import hashlib
+import sys
+from typing import Iterable
+
+
+def fingerprint(*parts: str) -> str:
+    h = hashlib.sha256()
+
+    for part in parts:
+        # the length prefix keeps ('ab', 'c') apart from ('a', 'bc')
+        data = part.encode()
+        h.update(len(data).to_bytes(8, 'little'))
+        h.update(data)
+
+    return h.hexdigest()
+
+
+def source_fingerprint(modules: Iterable[str]) -> str:
+    # the version of a builder is the content of the modules it runs
+    sources = []
+
+    for name in sorted(set(modules)):
+        with open(sys.modules[name].__file__, encoding='utf-8') as file:
+            sources.append(name)
+            sources.append(file.read())
+
+    return fingerprint(*sources)
@@ -1,27 +1,36 @@
-from typing import TypeVar, List, Set, Dict
+from typing import TypeVar, List, Set, Dict, Tuple
+
+from .fingerprint import fingerprint
 
 T = TypeVar('T')
 
 
 class GrammarToken:
-    def __init__(self, value: str, is_terminal: bool = False, is_main: bool = False) -> None:
+    # tokens are interned by their grammar, so equality and hashing are the
+    # default identity ones and `id` is the dense index of the token in
+    # Grammar.symbols
+    def __init__(self, value: str, is_terminal: bool = False, is_main: bool = False, id: int = -1) -> None:
         self.value: str = value
         self.is_terminal: bool = is_terminal and not is_main
         self.is_main: bool = is_main
-
-    def __eq__(self, other) -> bool:
-        return self.value == other.value
-
-    def __hash__(self) -> int:
-        return hash(self.value)
+        self.id: int = id
 
     def __str__(self) -> str:
         return self.value
 
 
 class EOF(GrammarToken):
+    instance: 'EOF' = None
+
+    def __new__(cls) -> 'EOF':
+        if cls.instance is None:
+            cls.instance = super().__new__(cls)
+            GrammarToken.__init__(cls.instance, "EOF", True, id=0)
+
+        return cls.instance
+
     def __init__(self) -> None:
-        super().__init__("EOF", True)
+        pass
 
 
 class GrammarProduction:
@@ -45,6 +54,12 @@ class GrammarProduction:
         return hash(str(self.ind))
 
 
+# associativity of the yacc style precedence declarations
+LEFT = 'left'
+RIGHT = 'right'
+NONASSOC = 'nonassoc'
+
+
 class Grammar:
     def __init__(self) -> None:
         self.main = None
@@ -54,44 +69,53 @@ class Grammar:
         self.firsts: Dict[GrammarToken, Set[GrammarToken]] = {}
         self.follows: Dict[GrammarToken, Set[GrammarToken]] = {}
 
+        self.symbols: List[GrammarToken] = [EOF()]
+        self.tokens: Dict[str, GrammarToken] = {EOF().value: EOF()}
+        self.nullable: List[bool] = []
+        self.first_masks: List[int] = []
+        self.follow_masks: List[int] = []
+        self.suffix_firsts: List[List[Tuple[int, bool]]] = []
+
+        self.precedences: Dict[GrammarToken, Tuple[int, str]] = {}
+        self.production_precedences: Dict[int, GrammarToken] = {}
+
     def get_production(self, idx: int) -> GrammarProduction:
         return self.productions[idx]
 
     def get_tokens(self):
-        for t in self.non_terminals:
+        for t in self.symbols:
             yield t
 
-        for t in self.terminals:
-            yield t
+    def get_token(self, value: str) -> GrammarToken | None:
+        return self.tokens.get(value)
 
-    def get_token(self, value: str) -> GrammarToken:
-        for t in self.non_terminals:
-            if t.value == value:
-                return t
+    def get_token_id(self, value: str) -> int:
+        return self.tokens[value].id
 
-        for t in self.terminals:
-            if t.value == value:
-                return t
+    def get_symbol(self, id: int) -> GrammarToken:
+        return self.symbols[id]
 
-    def add_main(self, non_terminal: str) -> None:
-        self.main = GrammarToken(non_terminal)
-        self.main.is_main = True
+    def intern(self, value: str, is_terminal: bool = False, is_main: bool = False) -> GrammarToken:
+        if value in self.tokens:
+            return self.tokens[value]
 
-        self.non_terminals.add(self.main)
+        t = GrammarToken(value, is_terminal, is_main, len(self.symbols))
+        self.symbols.append(t)
+        self.tokens[value] = t
 
-    def add_production(self, non_terminal: str, sentences: List[str]) -> None:
-        def get(t: str):
-            t = GrammarToken(t, t[0].lower() == t[0])
+        if t.is_terminal:
+            self.terminals.add(t)
+        else:
+            self.non_terminals.add(t)
 
-            if t.is_terminal:
-                self.terminals.add(t)
-            else:
-                self.non_terminals.add(t)
+        return t
 
-            if t == self.main:
-                t = self.main
+    def add_main(self, non_terminal: str) -> None:
+        self.main = self.intern(non_terminal, is_main=True)
 
-            return t
+    def add_production(self, non_terminal: str, sentences: List[str]) -> None:
+        def get(t: str):
+            return self.intern(t, t[0].lower() == t[0])
 
         if non_terminal[0] != non_terminal[0].upper():
             raise ValueError("Non terminal must be in upper case")
@@ -99,97 +123,218 @@ class Grammar:
         head = get(non_terminal)
 
         for sentence in sentences:
-            tokens = sentence.split(" ")
-            body = [get(token) for token in tokens if token != "" and token != "EOF"]
+            tokens = [t for t in sentence.split(" ") if t != "" and t != "EOF"]
+            prec = None
+
+            # a trailing `%prec token` gives the production the precedence
+            # of that token instead of the one of its last terminal
+            if len(tokens) >= 2 and tokens[-2] == "%prec":
+                prec = self.intern(tokens[-1], True)
+                tokens = tokens[:-2]
+
+            production = GrammarProduction(
+                len(self.productions), head, [get(token) for token in tokens])
+            self.productions.append(production)
+
+            if prec is not None:
+                self.production_precedences[production.ind] = prec
+
+    def add_precedence(self, associativity: str, tokens: List[str]) -> None:
+        # every declaration binds tighter than the previous ones
+        if associativity not in (LEFT, RIGHT, NONASSOC):
+            raise ValueError(f"Unknown associativity {associativity}")
+
+        level = max((level for level, _ in self.precedences.values()), default=0) + 1
+
+        for t in tokens:
+            self.precedences[self.intern(t, True)] = level, associativity
+
+    def get_token_precedence(self, token: GrammarToken) -> Tuple[int, str] | None:
+        return self.precedences.get(token)
+
+    def get_production_precedence(self, production: GrammarProduction) -> Tuple[int, str] | None:
+        if production.ind in self.production_precedences:
+            return self.precedences.get(self.production_precedences[production.ind])
+
+        for t in reversed(production.body):
+            if t.is_terminal and t in self.precedences:
+                return self.precedences[t]
+
+        return None
+
+    def fingerprint(self) -> str:
+        # everything the parse tables depend on: the symbol ids, the
+        # productions, the precedences and the productions the parser skips
+        return fingerprint(
+            str(self.main),
+            " ".join(f"{t.value}:{int(t.is_terminal)}" for t in self.symbols),
+            "\n".join(str(p) for p in self.productions),
+            repr(sorted((t.value, level, a) for t, (level, a) in self.precedences.items())),
+            repr(sorted((i, t.value) for i, t in self.production_precedences.items())),
+            "".join(str(int(self.is_transparent(p))) for p in self.productions))
 
-            self.productions.append(
-                GrammarProduction(len(self.productions), head, body)
-            )
+    def is_transparent(self, production: GrammarProduction) -> bool:
+        # productions the parser may skip when reducing, the derivation of a
+        # plain grammar is its result so none of them is
+        return False
+
+    def get_mask(self, tokens: List[GrammarToken]) -> int:
+        mask = 0
+
+        for t in tokens:
+            mask |= 1 << t.id
+
+        return mask
+
+    def get_mask_tokens(self, mask: int) -> List[GrammarToken]:
+        tokens = []
+
+        while mask:
+            low = mask & -mask
+            tokens.append(self.symbols[low.bit_length() - 1])
+            mask ^= low
+
+        return tokens
+
+    def get_suffix_first(self, production: GrammarProduction, index: int) -> Tuple[int, bool]:
+        return self.suffix_firsts[production.ind][index]
+
+    def __get_bodies(self) -> Tuple[List[int], List[List[int]]]:
+        heads = [p.head.id for p in self.productions]
+        bodies = [[t.id for t in p.body] for p in self.productions]
+
+        return heads, bodies
+
+    def __calculate_nullable(self, heads: List[int], bodies: List[List[int]]):
+        self.nullable = [False for _ in self.symbols]
+
+        pending = [len(body) for body in bodies]
+        uses: List[List[int]] = [[] for _ in self.symbols]
+        q: List[int] = []
+
+        for i, body in enumerate(bodies):
+            for s in body:
+                uses[s].append(i)
+
+            if len(body) == 0 and not self.nullable[heads[i]]:
+                self.nullable[heads[i]] = True
+                q.append(heads[i])
+
+        while len(q) != 0:
+            s = q.pop()
+
+            for i in uses[s]:
+                pending[i] -= 1
+
+                if pending[i] == 0 and not self.nullable[heads[i]]:
+                    self.nullable[heads[i]] = True
+                    q.append(heads[i])
 
     def calculate_first(self):
-        for terminal in self.terminals:
-            self.firsts[terminal] = {terminal}
+        heads, bodies = self.__get_bodies()
+        self.__calculate_nullable(heads, bodies)
 
-        for non_terminal in self.non_terminals:
-            self.firsts[non_terminal] = set()
+        self.first_masks = [
+            1 << i if t.is_terminal else 0 for i, t in enumerate(self.symbols)]
+
+        # first(head) includes first(s) for every s of a nullable prefix
+        dependents: List[List[int]] = [[] for _ in self.symbols]
+
+        for head, body in zip(heads, bodies):
+            for s in body:
+                dependents[s].append(head)
+
+                if not self.nullable[s]:
+                    break
+
+        q = [i for i, t in enumerate(self.symbols) if t.is_terminal]
+
+        while len(q) != 0:
+            s = q.pop()
 
-        changed = True
+            for head in dependents[s]:
+                mask = self.first_masks[head] | self.first_masks[s]
 
-        while changed:
-            changed = False
+                if mask != self.first_masks[head]:
+                    self.first_masks[head] = mask
+                    q.append(head)
 
-            for production in self.productions:
-                head = production.head
-                body = production.body
+        self.suffix_firsts = []
 
-                all_eof = True
-                for token in body:
-                    for first in self.firsts[token]:
-                        if first not in self.firsts[head]:
-                            self.firsts[head].add(first)
-                            changed = True
+        for body in bodies:
+            suffix = [(0, True)]
 
-                    if EOF() not in self.firsts[token]:
-                        all_eof = False
-                        break
+            for s in reversed(body):
+                mask, nullable = suffix[-1]
 
-                if all_eof and EOF() not in self.firsts[head]:
-                    self.firsts[head].add(EOF())
-                    changed = True
+                if self.nullable[s]:
+                    suffix.append((self.first_masks[s] | mask, nullable))
+                else:
+                    suffix.append((self.first_masks[s], False))
+
+            suffix.reverse()
+            self.suffix_firsts.append(suffix)
+
+        for i, t in enumerate(self.symbols):
+            self.firsts[t] = set(self.get_mask_tokens(self.first_masks[i]))
+
+            if self.nullable[i]:
+                self.firsts[t].add(EOF())
 
     def calculate_sentence_first(
             self, tokens: List[GrammarToken]
     ) -> set[GrammarToken | EOF]:
-        result = set()
+        mask = 0
 
         all_eof = True
         for token in tokens:
-            for first in self.firsts[token]:
-                result.add(first)
+            s = token.id
+            mask |= self.first_masks[s]
 
-            if EOF() not in self.firsts[token]:
+            if not self.nullable[s]:
                 all_eof = False
                 break
 
-        if all_eof and EOF() not in result:
+        result = set(self.get_mask_tokens(mask))
+
+        if all_eof:
             result.add(EOF())
 
         return result
 
     def calculate_follow(self):
         self.calculate_first()
+        heads, bodies = self.__get_bodies()
 
-        for non_terminal in self.non_terminals:
-            self.follows[non_terminal] = set()
+        self.follow_masks = [0 for _ in self.symbols]
+        self.follow_masks[self.main.id] = self.get_mask([EOF()])
+
+        # follow(s) includes follow(head) when s ends a nullable suffix
+        dependents: List[List[int]] = [[] for _ in self.symbols]
 
-        self.follows[[token for token in self.non_terminals if token.is_main][0]].add(
-            EOF()
-        )
+        for p, (head, body) in enumerate(zip(heads, bodies)):
+            for i, s in enumerate(body):
+                if self.symbols[s].is_terminal:
+                    continue
 
-        changed = True
+                mask, nullable = self.suffix_firsts[p][i + 1]
+                self.follow_masks[s] |= mask
 
-        while changed:
-            changed = False
+                if nullable:
+                    dependents[head].append(s)
 
-            for production in self.productions:
-                head = production.head
-                body = production.body
+        q = [i for i, t in enumerate(self.symbols) if not t.is_terminal]
 
-                for i, token in enumerate(body):
-                    if token.is_terminal:
-                        continue
+        while len(q) != 0:
+            head = q.pop()
 
-                    firsts = self.calculate_sentence_first(body[i + 1:])
-                    for first in firsts:
-                        if first == EOF():
-                            continue
+            for s in dependents[head]:
+                mask = self.follow_masks[s] | self.follow_masks[head]
 
-                        if first not in self.follows[token]:
-                            self.follows[token].add(first)
-                            changed = True
+                if mask != self.follow_masks[s]:
+                    self.follow_masks[s] = mask
+                    q.append(s)
 
-                    if EOF() in firsts or i == len(body) - 1:
-                        for follow in self.follows[head]:
-                            if follow not in self.follows[token]:
-                                self.follows[token].add(follow)
-                                changed = True
+        for non_terminal in self.non_terminals:
+            self.follows[non_terminal] = set(self.get_mask_tokens(
+                self.follow_masks[non_terminal.id]))
@@ -11,7 +11,7 @@ class ItemLR:
         self.transitions: Dict[GrammarToken, Set[int]] = {}
 
     def __eq__(self, other) -> bool:
-        self.ind == other.ind
+        return self.ind == other.ind
 
     def __hash__(self) -> int:
         return self.ind
@@ -37,11 +37,3 @@ class ItemLR:
     def get_eof_transitions(self) -> List[int]:
         return self.get_transitions(EOF())
 
-
-class ItemLR1(ItemLR):
-    def __init__(self, ind: int, production: GrammarProduction, index: int, teal: GrammarToken) -> None:
-        super().__init__(ind, production, index)
-        self.teal = teal
-
-    def __str__(self) -> str:
-        return f"{self.production} {self.index} {self.teal}"
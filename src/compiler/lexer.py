@@ -7,6 +7,8 @@ IGNORE: str = 'IGNORE'
 
 
 class LexerToken:
+    __slots__ = ('value', 'row', 'col', 'type')
+
     def __init__(self, row: int, col: int, value: str, token_type: str) -> None:
         self.value: str = value
         self.row: int = row
@@ -37,16 +39,25 @@ class Lexer:
         self.tokens_automaton: List[List[Tuple[str, Automaton]]] = []
 
     @staticmethod
-    def build(name: str, tokens_automaton: List[Tuple[str, Automaton]], ignore_automaton: Automaton):
+    def build(name: str, tokens_automaton: List[Tuple[str, Automaton]], ignore_automaton: Automaton,
+              fingerprint: str = ''):
         result = [(IGNORE, ignore_automaton.to_dfa().to_json())]
 
         for t, a in tokens_automaton:
             result.append((t, a.to_dfa().to_json()))
 
-        json.dump(result, open(f'cache/{name}_lexer.json', 'w'))
+        json.dump({'fingerprint': fingerprint, 'tokens': result},
+                  open(f'cache/{name}_lexer.json', 'w'))
+
+    @staticmethod
+    def get_fingerprint(name: str) -> str | None:
+        try:
+            return json.load(open(f'cache/{name}_lexer.json')).get('fingerprint')
+        except (OSError, ValueError, AttributeError):
+            return None
 
     def load(self, name: str):
-        cache = json.load(open(f'cache/{name}_lexer.json'))
+        cache = json.load(open(f'cache/{name}_lexer.json'))['tokens']
         for t, v in cache:
             a = Automaton()
             a.from_json(v)
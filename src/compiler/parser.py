@@ -1,7 +1,8 @@
-from .grammar import Grammar, GrammarToken, EOF
-from .tableLR import TableLR, Action
-from typing import List
+from .grammar import Grammar, GrammarToken, EOF, GrammarProduction
+from .tableLR import TableLR, SHIFT, REDUCE, ACCEPT, ERROR
+from typing import Dict, List, Set, Tuple
 from .parser_out import ParseResult
+from .attributed_grammar import AttributedGrammar, PendingNode
 
 
 class Parser:
@@ -17,40 +18,440 @@ class Parser:
 
         return tokens
 
-    def parse(self, tokens: List[GrammarToken]) -> ParseResult:
-        self.table.reset()
-        tokens.append(EOF())
-        productions_result: List[GrammarToken] = []
+    def push(self) -> 'PushParser':
+        return PushParser(self.grammar, self.table)
 
+    def parse(self, tokens: List[GrammarToken], sync: List[GrammarToken] | None = None,
+              parents: bool = False) -> ParseResult:
+        return self.parse_ids([-1 if t is None else t.id for t in tokens],
+                              None if sync is None else set(t.id for t in sync), parents)
+
+    def parse_ids(self, ids: List[int], sync: Set[int] | None = None, parents: bool = False) -> ParseResult:
+        # without synchronizing tokens the parse stops at the first error,
+        # with them it recovers in panic mode and reports every error
+        table = self.table
+        action_base = table.action_base
+        action_check = table.action_check
+        action_next = table.action_next
+        action_default = table.action_default
+        lengths = table.production_lengths
+        heads = table.production_heads
+        productions = self.grammar.productions
+
+        # the stack only keeps states, the symbol of each entry is implied
+        # by the state it entered
+        stack: List[int] = [0]
+        productions_result: List[GrammarProduction] = []
+
+        errors: List[int] = []
+        shifted: int = 0
+
+        eof = EOF().id
         index: int = 0
-        stack_tokens: List[GrammarToken] = []
 
         while True:
-            action, ind = self.table.action(tokens[index])
+            state = stack[-1]
+            code = action_default[state]
+
+            if code < 0:
+                code = -code
+            else:
+                token = ids[index] if index < len(ids) else eof
+
+                if token < 0:
+                    code = ERROR
+                else:
+                    i = action_base[state] + token
+
+                    if action_check[i] == token:
+                        code = action_next[i]
+
+            kind = code & 3
 
-            if action == Action.SHIFT:
-                self.shift_action(stack_tokens, tokens[index])
+            if kind == SHIFT:
+                stack.append(code >> 2)
                 index += 1
+                shifted += 1
 
-            if action == Action.REDUCE:
-                self.reduce_action(stack_tokens, ind, productions_result)
+            elif kind == REDUCE:
+                ind = code >> 2
+                productions_result.append(productions[ind])
 
-            if action == Action.ERROR:
-                return ParseResult(error=index)
+                if lengths[ind] != 0:
+                    del stack[-lengths[ind]:]
+
+                stack.append(table.get_goto(stack[-1], heads[ind]))
+
+            elif kind == ACCEPT:
+                if len(errors) != 0:
+                    return ParseResult(error=errors[0], errors=errors)
 
-            if action == Action.ACCEPT:
                 productions_result.reverse()
-                return ParseResult(derivations=productions_result)
+                return ParseResult(derivations=productions_result, parents=parents)
+
+            elif sync is None:
+                return ParseResult(error=index)
+
+            else:
+                # like yacc, errors found before three tokens are shifted
+                # after the previous one are taken as its consequence
+                if len(errors) == 0 or shifted >= 3:
+                    errors.append(index)
+
+                index = self.__recover(stack, ids, index, sync)
+                shifted = 0
+
+                if index == -1:
+                    return ParseResult(error=errors[0], errors=errors)
+
+    def __recover(self, stack: List[int], ids: List[int], index: int, sync: Set[int]) -> int:
+        # discards the input up to a synchronizing token (or the EOF) that
+        # some state of the stack can shift, and pops the stack down to it.
+        # Returns the index to resume from, -1 when the input runs out
+        eof = EOF().id
+
+        while True:
+            token = ids[index] if index < len(ids) else eof
+
+            if token == eof or token in sync:
+                for depth in range(len(stack), 0, -1):
+                    if self.__can_shift(stack[:depth], token):
+                        del stack[depth:]
+                        return index
+
+                if token == eof:
+                    return -1
+
+            index += 1
+
+    def __can_shift(self, stack: List[int], token: int) -> bool:
+        table = self.table
+
+        while True:
+            code = table.get_action(stack[-1], token)
+            kind = code & 3
+
+            if kind == SHIFT or kind == ACCEPT:
+                return True
+
+            if kind == ERROR:
+                return False
+
+            ind = code >> 2
+            length = table.production_lengths[ind]
+
+            if length != 0:
+                del stack[-length:]
+
+            stack.append(table.get_goto(stack[-1], table.production_heads[ind]))
 
-    def shift_action(self, stack_tokens: List[GrammarToken], token: GrammarToken):
-        stack_tokens.append(token)
+    def evaluate(self, tokens: List[GrammarToken], values: List) -> ParseResult:
+        return self.evaluate_ids([-1 if t is None else t.id for t in tokens], values)
+
+    def evaluate_ids(self, ids: List[int], values: List) -> ParseResult:
+        # runs the rules of an attributed grammar on an attribute stack at
+        # each reduce instead of building a derivation tree. Productions
+        # whose head inherits an attribute are kept as pending nodes until
+        # their parent is reduced
+        grammar: AttributedGrammar = self.grammar
+        table = self.table
+        action_base = table.action_base
+        action_check = table.action_check
+        action_next = table.action_next
+        action_default = table.action_default
+        lengths = table.production_lengths
+        heads = table.production_heads
+        rules = grammar.rules
+
+        inherited = grammar.get_inherited()
+        pending = [p.head in inherited for p in grammar.productions]
+        resolve = [len(r.actions) != 0 or any(t in inherited for t in p.body)
+                   for p, r in zip(grammar.productions, rules)]
+
+        stack: List[int] = [0]
+        attributes: List = []
+
+        eof = EOF().id
+        index: int = 0
+
+        while True:
+            state = stack[-1]
+            code = action_default[state]
+
+            if code < 0:
+                code = -code
+            else:
+                token = ids[index] if index < len(ids) else eof
+
+                if token < 0:
+                    return ParseResult(error=index)
+
+                i = action_base[state] + token
+
+                if action_check[i] == token:
+                    code = action_next[i]
+
+            kind = code & 3
+
+            if kind == SHIFT:
+                stack.append(code >> 2)
+                attributes.append(values[index])
+                index += 1
+
+            elif kind == REDUCE:
+                ind = code >> 2
+                length = lengths[ind]
+
+                if length != 0:
+                    children = attributes[-length:]
+                    del stack[-length:]
+                    del attributes[-length:]
+                else:
+                    children = []
+
+                if pending[ind]:
+                    attributes.append(PendingNode(ind, children))
+                elif resolve[ind]:
+                    attributes.append(grammar.evaluate_production(ind, children))
+                else:
+                    attributes.append(rules[ind].header_action(
+                        [None] * (length + 1), [None] + children))
+
+                stack.append(table.get_goto_bypass(stack[-1], heads[ind]))
+
+            elif kind == ACCEPT:
+                value = attributes[-1]
+
+                if isinstance(value, PendingNode):
+                    value = grammar.evaluate_production(value.production_ind, value.children)
+
+                return ParseResult(value=value)
+
+            else:
+                return ParseResult(error=index)
+
+
+class PushParser:
+    # parses a stream of tokens as they arrive: each feed advances the
+    # automaton as far as the new token allows and returns the reductions it
+    # completed, and finish feeds the EOF and builds the result
+
+    def __init__(self, grammar: Grammar, tableLR: TableLR) -> None:
+        self.grammar: Grammar = grammar
+        self.table: TableLR = tableLR
 
-    def reduce_action(self, stack_tokens: List[GrammarToken], ind: int, productions_result: List[GrammarToken]) -> GrammarToken:
-        production = self.grammar.get_production(ind)
-        productions_result.append(production)
-        # print(production)
+        self.stack: List[int] = [0]
+        self.reductions: List[GrammarProduction] = []
+        self.index: int = 0
+        self.error: int = -1
+        self.accepted: bool = False
 
-        for t in production.body:
-            stack_tokens.pop()
-            
-        stack_tokens.append(production.head)
+        self.__reduce_defaults()
+
+    @property
+    def ok(self) -> bool:
+        return self.error == -1
+
+    def feed(self, token: GrammarToken | None) -> List[GrammarProduction]:
+        return self.feed_id(-1 if token is None else token.id)
+
+    def feed_id(self, token: int) -> List[GrammarProduction]:
+        if not self.ok or self.accepted:
+            return []
+
+        start = len(self.reductions)
+
+        while True:
+            code = ERROR if token < 0 else self.table.get_action(self.stack[-1], token)
+            kind = code & 3
+
+            if kind == SHIFT:
+                self.stack.append(code >> 2)
+                self.index += 1
+
+                # states that reduce whatever comes next are left at once,
+                # so their reductions are emitted without waiting for a token
+                self.__reduce_defaults()
+                break
+
+            elif kind == REDUCE:
+                self.__reduce(code >> 2)
+
+            elif kind == ACCEPT:
+                self.accepted = True
+                break
+
+            else:
+                self.error = self.index
+                break
+
+        return self.reductions[start:]
+
+    def finish(self) -> ParseResult:
+        self.feed_id(EOF().id)
+
+        if not self.ok:
+            return ParseResult(error=self.error)
+
+        return ParseResult(derivations=self.reductions[::-1])
+
+    def __reduce(self, ind: int):
+        table = self.table
+        length = table.production_lengths[ind]
+
+        self.reductions.append(self.grammar.productions[ind])
+
+        if length != 0:
+            del self.stack[-length:]
+
+        self.stack.append(table.get_goto(self.stack[-1], table.production_heads[ind]))
+
+    def __reduce_defaults(self):
+        default = self.table.action_default
+
+        while default[self.stack[-1]] < 0 and -default[self.stack[-1]] & 3 == REDUCE:
+            self.__reduce(-default[self.stack[-1]] >> 2)
+
+
+class StackEntry:
+    # an entry of a persistent parse stack: entries are never modified, so a
+    # snapshot of the whole stack is just a reference to its top
+    __slots__ = ('state', 'value', 'start', 'below')
+
+    def __init__(self, state: int, value, start: int, below: 'StackEntry | None') -> None:
+        self.state: int = state
+        self.value = value
+        self.start: int = start
+        self.below: StackEntry | None = below
+
+
+class IncrementalParser:
+    # evaluates an attributed grammar like Parser.evaluate and keeps what is
+    # needed to reparse the program after an edit of its tokens: the stack
+    # before each token, and every reduced subtree with its span, the state
+    # it was reduced on and its value. An edit resumes from the last stack
+    # before the edited tokens, and a subtree whose tokens (and lookahead)
+    # are untouched is shifted whole when the parser reaches its start in the
+    # same state, instead of being parsed and evaluated again
+
+    def __init__(self, grammar: AttributedGrammar, tableLR: TableLR) -> None:
+        self.grammar: AttributedGrammar = grammar
+        self.table: TableLR = tableLR
+
+        self.ids: List[int] = []
+        self.values: List = []
+        self.snapshots: List[StackEntry | None] = []
+        self.subtrees: Dict[int, List[Tuple[int, int, int, object]]] = {}
+
+    def parse(self, tokens: List[GrammarToken], values: List) -> ParseResult:
+        self.ids = [-1 if t is None else t.id for t in tokens]
+        self.values = list(values)
+        self.snapshots = [None] * (len(self.ids) + 1)
+        self.subtrees = {}
+
+        return self.__run(0, StackEntry(0, None, 0, None))
+
+    def edit(self, start: int, end: int, tokens: List[GrammarToken], values: List) -> ParseResult:
+        # replaces the tokens in [start, end) and reparses
+        delta = len(tokens) - (end - start)
+
+        # a subtree is kept while its tokens and its lookahead are untouched
+        subtrees = {}
+
+        for i, trees in self.subtrees.items():
+            if i >= end:
+                subtrees[i + delta] = [(e + delta, s, h, v) for e, s, h, v in trees]
+            elif i < start:
+                trees = [tree for tree in trees if tree[0] < start]
+
+                if len(trees) != 0:
+                    subtrees[i] = trees
+
+        self.subtrees = subtrees
+        self.ids[start:end] = [-1 if t is None else t.id for t in tokens]
+        self.values[start:end] = values
+        self.snapshots[start + 1:] = [None] * (len(self.ids) - start)
+
+        index = start
+
+        while self.snapshots[index] is None:
+            index -= 1
+
+        return self.__run(index, self.snapshots[index])
+
+    def __run(self, index: int, top: StackEntry) -> ParseResult:
+        grammar = self.grammar
+        table = self.table
+        lengths = table.production_lengths
+        heads = table.production_heads
+        rules = grammar.rules
+
+        inherited = grammar.get_inherited()
+        pending = [p.head in inherited for p in grammar.productions]
+        resolve = [len(r.actions) != 0 or any(t in inherited for t in p.body)
+                   for p, r in zip(grammar.productions, rules)]
+
+        ids = self.ids
+        snapshots = self.snapshots
+        subtrees = self.subtrees
+
+        eof = EOF().id
+        snapshots[index] = top
+
+        while True:
+            token = ids[index] if index < len(ids) else eof
+            code = ERROR if token < 0 else table.get_action(top.state, token)
+            kind = code & 3
+
+            if kind == SHIFT:
+                reused = None
+
+                for tree in reversed(subtrees.get(index, [])):
+                    if tree[1] == top.state and tree[0] > index and \
+                            (reused is None or tree[0] > reused[0]):
+                        reused = tree
+
+                if reused is None:
+                    top = StackEntry(code >> 2, self.values[index], index, top)
+                    index += 1
+                    snapshots[index] = top
+                else:
+                    # the subtree was reduced looking at the token after it,
+                    # so the stack is no place to resume an edit of that token
+                    end, _, head, value = reused
+                    top = StackEntry(table.get_goto_bypass(top.state, head), value, index, top)
+                    index = end
+                    snapshots[index] = None
+
+            elif kind == REDUCE:
+                ind = code >> 2
+                length = lengths[ind]
+
+                children = [None] * length
+                start = index
+
+                for i in range(length - 1, -1, -1):
+                    children[i] = top.value
+                    start = top.start
+                    top = top.below
+
+                if pending[ind]:
+                    value = PendingNode(ind, children)
+                elif resolve[ind]:
+                    value = grammar.evaluate_production(ind, children)
+                else:
+                    value = rules[ind].header_action([None] * (length + 1), [None] + children)
+
+                subtrees.setdefault(start, []).append((index, top.state, heads[ind], value))
+                top = StackEntry(table.get_goto_bypass(top.state, heads[ind]), value, start, top)
+
+            elif kind == ACCEPT:
+                value = top.value
+
+                if isinstance(value, PendingNode):
+                    value = grammar.evaluate_production(value.production_ind, value.children)
+
+                return ParseResult(value=value)
+
+            else:
+                return ParseResult(error=index)
@@ -4,6 +4,8 @@ from .grammar import GrammarToken, GrammarProduction
 
 
 class DerivationTree:
+    __slots__ = ('token', 'children', 'father', 'production_ind')
+
     def __init__(self, token: GrammarToken, father: 'DerivationTree | None' = None) -> None:
         self.token: GrammarToken = token
         self.children: List[DerivationTree] = []
@@ -18,32 +20,41 @@ class DerivationTree:
 
 
 class ParseResult:
-    def __init__(self, derivations: List[GrammarProduction] = [], error: int = -1) -> None:
+    # a parse that evaluates its attributes while reducing gives its `value`
+    # and builds no derivation tree. The nodes of the tree only point to
+    # their father when `parents` is asked for
+    def __init__(self, derivations: List[GrammarProduction] = [], error: int = -1, value=None,
+                 errors: List[int] | None = None, parents: bool = False) -> None:
         self.ok: bool = error == -1
         self.error = error
-        self.derivation_tree = ParseResult.__build_tree(derivations) if self.ok else None
-
-    def __build_tree(derivations: List[GrammarProduction]) -> DerivationTree:
+        self.errors: List[int] = errors if errors is not None else [] if self.ok else [error]
+        self.value = value
+        self.derivation_tree = ParseResult.__build_tree(derivations, parents) \
+            if self.ok and len(derivations) != 0 else None
+
+    def __build_tree(derivations: List[GrammarProduction], parents: bool) -> DerivationTree:
+        # the derivations come in rightmost derivation order, so the children
+        # of each node are expanded right to left, over an explicit stack
         root = DerivationTree(derivations[0].head)
-        ParseResult.__build_tree_node(root, derivations, 0)
+        root.production_ind = derivations[0].ind
 
-        return root
+        stack = [(root, derivations[0].body.copy())]
+        index = 0
 
-    def __build_tree_node(node: DerivationTree, derivations: List[GrammarProduction], index: int) -> int:
-        node.production_ind = derivations[index].ind
+        while len(stack) != 0:
+            node, body = stack[-1]
 
-        tokens = derivations[index].body.copy()
-        tokens.reverse()
+            if len(body) == 0:
+                node.children.reverse()
+                stack.pop()
+                continue
 
-        for token in tokens:
-            if token.is_terminal:
-                node.add_child(DerivationTree(token, node))
-            else:
-                child = DerivationTree(token, node)
-                node.add_child(child)
+            child = DerivationTree(body.pop(), node if parents else None)
+            node.add_child(child)
 
-                index = ParseResult.__build_tree_node(child, derivations, index + 1)
+            if not child.token.is_terminal:
+                index += 1
+                child.production_ind = derivations[index].ind
+                stack.append((child, derivations[index].body.copy()))
 
-        node.children.reverse()
-
-        return index
+        return root
@@ -1,6 +1,12 @@
 import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
 from enum import Enum
-from typing import List, Tuple, Dict
+from typing import Callable, List, Tuple, Dict, Sequence
 
 from .grammar import Grammar, GrammarToken
 
@@ -27,9 +33,19 @@ class NodeAction:
         self.ind = ind
         self.terminal_actions: Dict[GrammarToken, Tuple[Action, int]] = {}
         self.no_terminal_actions: Dict[GrammarToken, int] = {}
+        self.conflicts: Dict[GrammarToken, List[Tuple[Action, int]]] = {}
 
     def add_terminal_action(self, token: GrammarToken, action: Action, ind: int) -> bool:
         if token in self.terminal_actions:
+            if self.terminal_actions[token] == (action, ind):
+                return True
+
+            actions = self.conflicts.setdefault(
+                token, [self.terminal_actions[token]])
+
+            if (action, ind) not in actions:
+                actions.append((action, ind))
+
             return False
 
         self.terminal_actions[token] = action, ind
@@ -44,76 +60,330 @@ class NodeAction:
 
         return True
 
-    def to_json(self):
-        return {
-            "ind": self.ind,
-            "terminal_actions": {str(key): (value[0].name, value[1]) for key, value in self.terminal_actions.items()},
-            "no_terminal_actions": {str(key): value for key, value in self.no_terminal_actions.items()}
-        }
 
-    def from_json(data: Dict) -> 'NodeAction':
-        ind = data["ind"]
-        node_action = NodeAction(ind)
+# packed action encoding: the two low bits hold the kind of action and the
+# rest the target state of a shift or the production of a reduce
+ERROR = 0
+SHIFT = 1
+REDUCE = 2
+ACCEPT = 3
+
+# binary tables are a little endian u32 header length and a json header
+# followed by the int32 vectors, so they can be mapped read only and shared
+# through the page cache by every process using them
+TABLE_MAGIC = b"HLKT"
+
+
+def pack_rows(rows: List[Dict[int, int]], width: int) -> Tuple[List[int], List[int], List[int]]:
+    # row displacement: every distinct row is placed at the first free offset
+    # where its cells do not collide with the cells already placed, and the
+    # check vector records the column that owns each cell. Identical rows
+    # share their offset, distinct rows never do.
+    base = [0] * len(rows)
+    check: List[int] = []
+    values: List[int] = []
+
+    placed: Dict[Tuple[Tuple[int, int], ...], int] = {}
+    used_bases = set()
+    first_free = 0
+
+    order = sorted(range(len(rows)), key=lambda r: len(rows[r]), reverse=True)
+
+    for r in order:
+        row = rows[r]
+        key = tuple(sorted(row.items()))
+
+        if len(row) == 0:
+            continue
+
+        if key in placed:
+            base[r] = placed[key]
+            continue
+
+        offset = max(first_free - min(row), 0)
+
+        while offset in used_bases or any(offset + c < len(check) and check[offset + c] != -1 for c in row):
+            offset += 1
+
+        top = offset + max(row) + 1
+
+        if top > len(check):
+            check.extend([-1] * (top - len(check)))
+            values.extend([0] * (top - len(values)))
+
+        for c, value in row.items():
+            check[offset + c] = c
+            values[offset + c] = value
+
+        base[r] = offset
+        placed[key] = offset
+        used_bases.add(offset)
+
+        while first_free < len(check) and check[first_free] != -1:
+            first_free += 1
+
+    # empty rows point past every placed cell
+    empty_base = len(check)
+
+    for r, row in enumerate(rows):
+        if len(row) == 0:
+            base[r] = empty_base
+
+    # any row offset plus any column stays inside the vectors
+    padding = max(base, default=0) + width - len(check)
 
-        for key, value in data["terminal_actions"].items():
-            node_action.add_terminal_action(
-                GrammarToken(key), Action.str_to_action(value[0]), int(value[1]))
+    if padding > 0:
+        check.extend([-1] * padding)
+        values.extend([0] * padding)
 
-        for key, value in data["no_terminal_actions"].items():
-            node_action.add_no_terminal_action(GrammarToken(key), int(value))
+    return base, check, values
 
-        return node_action
+
+def most_common(values: List[int], default: int) -> int:
+    counts: Dict[int, int] = {}
+
+    for v in values:
+        counts[v] = counts.get(v, 0) + 1
+
+    return max(counts, key=lambda v: counts[v], default=default)
+
+
+def unit_reduce_heads(node_actions: List[NodeAction], grammar: Grammar) -> List[int]:
+    # for every state whose only action is reducing a transparent unit
+    # production A -> B, the id of A (and -1 for the other states). An
+    # evaluating parser can skip such a state by taking the goto on A of the
+    # state below instead, while derivation trees keep the unit node
+    heads = [-1] * len(node_actions)
+
+    for node in node_actions:
+        actions = set(node.terminal_actions.values())
+
+        if len(actions) != 1:
+            continue
+
+        action, ind = actions.pop()
+
+        if action != Action.REDUCE:
+            continue
+
+        production = grammar.get_production(ind)
+
+        if grammar.is_transparent(production):
+            heads[node.ind] = production.head.id
+
+    return heads
 
 
 class TableLR:
+    # compressed tables: the action of state s on token t is
+    # next[base[s] + t] when check[base[s] + t] == t, and otherwise the
+    # default reduction of s (or an error). A negative default marks a state
+    # that always reduces, whatever the lookahead. Gotos are compressed the
+    # same way by non terminal, falling back to its most common target state.
+
     def __init__(self, grammar: Grammar) -> None:
         self.grammar: Grammar = grammar
-        self.stack_states: List[int] = [0]
-        self.node_actions: List[NodeAction] = []
-
-    def reset(self):
-        self.stack_states = [0]
 
-    def build(name: str, node_actions: List[NodeAction]):
-        cache_json = json.dumps([node_action.to_json()
-                                 for node_action in node_actions])
+        self.action_base: Sequence[int] = array('i')
+        self.action_check: Sequence[int] = array('i')
+        self.action_next: Sequence[int] = array('i')
+        self.action_default: Sequence[int] = array('i')
+        self.goto_base: Sequence[int] = array('i')
+        self.goto_check: Sequence[int] = array('i')
+        self.goto_next: Sequence[int] = array('i')
+        self.goto_default: Sequence[int] = array('i')
+        self.production_lengths: Sequence[int] = array('i')
+        self.production_heads: Sequence[int] = array('i')
+        self.unit_heads: Sequence[int] = array('i')
+
+    def build(name: str, node_actions: List[NodeAction], grammar: Grammar, fingerprint: str = ""):
+        n = len(grammar.symbols)
+
+        action_rows: List[Dict[int, int]] = []
+        action_default: List[int] = []
+
+        for node in node_actions:
+            row = {}
+
+            for token, (action, ind) in node.terminal_actions.items():
+                if action == Action.SHIFT:
+                    row[token.id] = ind << 2 | SHIFT
+                elif action == Action.REDUCE:
+                    row[token.id] = ind << 2 | REDUCE
+                elif action == Action.ACCEPT:
+                    row[token.id] = ACCEPT
+                else:
+                    row[token.id] = ERROR
+
+            reduces = [code for code in row.values() if code & 3 == REDUCE]
+            default = most_common(reduces, ERROR)
+            row = {t: code for t, code in row.items() if code != default}
+
+            # a state that can only reduce does it without reading the
+            # lookahead, which is flagged by a negative default
+            action_rows.append(row)
+            action_default.append(-default if len(row) == 0 else default)
+
+        goto_rows: List[Dict[int, int]] = [{} for _ in range(n)]
+
+        for node in node_actions:
+            for token, ind in node.no_terminal_actions.items():
+                goto_rows[token.id][node.ind] = ind
+
+        goto_default = [most_common(list(row.values()), -1) for row in goto_rows]
+        goto_rows = [{s: ind for s, ind in row.items() if ind != goto_default[t]}
+                     for t, row in enumerate(goto_rows)]
+
+        action_base, action_check, action_next = pack_rows(action_rows, n)
+        goto_base, goto_check, goto_next = pack_rows(
+            goto_rows, len(node_actions))
+
+        arrays = {
+            "action_base": action_base,
+            "action_check": action_check,
+            "action_next": action_next,
+            "action_default": action_default,
+            "goto_base": goto_base,
+            "goto_check": goto_check,
+            "goto_next": goto_next,
+            "goto_default": goto_default,
+            "production_lengths": [len(p.body) for p in grammar.productions],
+            "production_heads": [p.head.id for p in grammar.productions],
+            "unit_heads": unit_reduce_heads(node_actions, grammar)
+        }
 
-        with open(f"cache/{name}_parse.json", "w") as file:
-            file.write(cache_json)
+        header = json.dumps({
+            "fingerprint": fingerprint,
+            "symbols": [t.value for t in grammar.symbols],
+            "arrays": [[key, len(value)] for key, value in arrays.items()]
+        }).encode()
+
+        # the table is written aside and renamed so that processes mapping
+        # the previous file keep a consistent copy. That holds on POSIX only:
+        # Windows refuses to replace a file while it is mapped, so the shared
+        # table of this process is dropped first (its mapping is released
+        # once the parsers holding it are gone) and a file still mapped, here
+        # or by another process, makes the rebuild fail
+        path = f"cache/{name}_parse.bin"
+        TableLR.shared.pop(name, None)
+
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(TABLE_MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            file.write(bytes(-(len(header) + 8) % 4))
+
+            for value in arrays.values():
+                value = array('i', value)
+
+                if sys.byteorder != "little":
+                    value.byteswap()
+
+                file.write(value.tobytes())
+
+        try:
+            os.replace(f"{path}.tmp", path)
+        except PermissionError as e:
+            os.remove(f"{path}.tmp")
+            raise PermissionError(
+                f"Table {name} is mapped by a running parser and cannot be replaced, "
+                "close the parsers using it and build again") from e
+
+    @staticmethod
+    def get_fingerprint(name: str) -> str | None:
+        # fingerprint of the inputs the table was built from, None when
+        # there is no usable table
+        try:
+            with open(f"cache/{name}_parse.bin", "rb") as file:
+                data = file.read(8)
+
+                if data[:4] != TABLE_MAGIC:
+                    return None
+
+                header_len, = struct.unpack_from("<I", data, 4)
+                header = json.loads(file.read(header_len))
+        except (OSError, ValueError, struct.error):
+            return None
+
+        return header.get("fingerprint")
+
+    # tables shared by every parse of the process, by name
+    shared: Dict[str, 'TableLR'] = {}
+    shared_lock = threading.Lock()
+
+    @staticmethod
+    def load_shared(name: str, grammar: Grammar, build: Callable[[], bool]) -> 'TableLR':
+        # the table is loaded once and then only read, so every parse of every
+        # thread shares it. build refreshes a table stale for the current
+        # grammar or builder and tells whether it is free of conflicts
+        with TableLR.shared_lock:
+            table = TableLR.shared.get(name)
+
+            if table is None:
+                if not build():
+                    raise ValueError(f'The {name} grammar has conflicts')
+
+                table = TableLR(grammar)
+                table.load(name)
+                TableLR.shared[name] = table
+
+        return table
 
     def load(self, name: str):
-        cache = json.load(open(f"cache/{name}_parse.json"))
-        self.node_actions = [NodeAction.from_json(x) for x in cache]
+        with open(f"cache/{name}_parse.bin", "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if data[:4] != TABLE_MAGIC:
+            raise ValueError(f"Table {name} is not a parse table")
+
+        header_len, = struct.unpack_from("<I", data, 4)
+        header = json.loads(data[8:8 + header_len])
+
+        if header["symbols"] != [t.value for t in self.grammar.symbols]:
+            raise ValueError(f"Table {name} was built for another grammar")
+
+        view = memoryview(data)
+        offset = 8 + header_len + (-(header_len + 8) % 4)
+
+        for key, length in header["arrays"]:
+            value = view[offset:offset + 4 * length].cast('i')
+
+            if sys.byteorder != "little":
+                value = array('i', value)
+                value.byteswap()
 
-    def action(self, token: GrammarToken) -> Tuple[Action, int]:
-        node = self.node_actions[self.stack_states[-1]]
+            setattr(self, key, value)
+            offset += 4 * length
 
-        if token in node.terminal_actions:
-            action, ind = node.terminal_actions[token]
+    def get_action(self, state: int, token: int) -> int:
+        default = self.action_default[state]
 
-            if action == Action.SHIFT:
-                return self.action_shift(action, ind)
+        if default < 0:
+            return -default
 
-            if action == Action.REDUCE:
-                return self.action_reduce(action, ind)
+        i = self.action_base[state] + token
 
-            if action == Action.ACCEPT:
-                return action, -1
+        if self.action_check[i] == token:
+            return self.action_next[i]
 
-        return Action.ERROR, -1
+        return default
 
-    def action_shift(self, action: Action, ind: int) -> Tuple[Action, int]:
-        self.stack_states.append(ind)
+    def get_goto(self, state: int, token: int) -> int:
+        i = self.goto_base[token] + state
 
-        return action, -1
+        if self.goto_check[i] == state:
+            return self.goto_next[i]
 
-    def action_reduce(self, action: Action, ind: int) -> Tuple[Action, int]:
-        production = self.grammar.get_production(ind)
+        return self.goto_default[token]
 
-        for t in production.body:
-            self.stack_states.pop()
+    def get_goto_bypass(self, state: int, token: int) -> int:
+        # the goto of an evaluating parse, which jumps over the states that
+        # only reduce a transparent unit production (the value is the same)
+        target = self.get_goto(state, token)
+        head = self.unit_heads[target]
 
-        self.stack_states.append(
-            self.node_actions[self.stack_states[-1]].no_terminal_actions[production.head])
+        while head >= 0:
+            target = self.get_goto(state, head)
+            head = self.unit_heads[target]
 
-        return action, ind
+        return target
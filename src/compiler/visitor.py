@@ -53,23 +53,27 @@ class Dispatcher(object):
     self.param_index = self.__argspec(fn).args.index(param_name)
     self.param_name = param_name
     self.targets = {}
+    self.cache = {}
 
   def __call__(self, *args, **kw):
     typ = args[self.param_index].__class__
-    d = self.targets.get(typ)
-    if d is not None:
-      return d(*args, **kw)
-    else:
-      issub = issubclass
-      t = self.targets
-      ks = t.keys()
-      ans = [t[k](*args, **kw) for k in ks if issub(typ, k)]
-      if len(ans) == 1:
-        return ans.pop()
-      return ans
+    d = self.cache.get(typ)
+    if d is None:
+      d = self.cache[typ] = self.__resolve(typ)
+    return d(*args, **kw)
+
+  def __resolve(self, typ):
+    # the target of the most specific class in the MRO of typ, resolved once
+    # per concrete class so later calls are a single dict hit
+    t = self.targets
+    for k in typ.__mro__:
+      if k in t:
+        return t[k]
+    return lambda *args, **kw: []
 
   def add_target(self, typ, target):
     self.targets[typ] = target
+    self.cache.clear()
 
   @staticmethod
   def __argspec(fn):
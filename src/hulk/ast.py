@@ -7,10 +7,12 @@ from hulk.semanticTools import Type
 
 
 class ASTNode(ABC):
-    pass
+    __slots__ = ()
 
 
 class ProgramNode(ASTNode):
+    __slots__ = ('first_is', 'expression', 'second_is')
+
     def __init__(self, first_is, expression, second_is):
         self.first_is: List[InstructionNode] = first_is
         self.expression: ExpressionNode = expression
@@ -18,119 +20,155 @@ class ProgramNode(ASTNode):
 
 
 class InstructionNode(ASTNode):
-    pass
+    __slots__ = ()
 
 
 class ExpressionNode(ASTNode):
+    __slots__ = ('type',)
+
     def define_type(self, value: Type):
         self.type = value
 
 
 class TypeNode(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name: LexerToken = name
 
 
 class VectorTypeNode(TypeNode):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name)
 
 
 class ParameterNode(ASTNode):
+    __slots__ = ('name', 'type')
+
     def __init__(self, name, type):
         self.name: LexerToken = name
         self.type: TypeNode = type
 
 
 class EOFNode(ASTNode):
-    pass
+    __slots__ = ()
 
 
 class EOFExtensionNode(EOFNode):
-    pass
+    __slots__ = ()
 
 
 class EOFInheritsNode(EOFNode):
-    pass
+    __slots__ = ()
 
 
 class EOFTypeNode(EOFNode):
-    pass
+    __slots__ = ()
 
 
 class ProtocolTypeNode(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name: LexerToken = name
 
 
 class ClassTypeNode(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name: LexerToken = name
 
 
 class ClassTypeParameterNode(ClassTypeNode):
+    __slots__ = ('parameters',)
+
     def __init__(self, name, parameters):
         super().__init__(name)
         self.parameters: List[ParameterNode] = parameters
 
 
 class ExtensionNode(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name: LexerToken = name
 
 
 class InheritanceNode(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name: LexerToken = name
 
 
 class InheritanceParameterNode(InheritanceNode):
+    __slots__ = ('parameters',)
+
     def __init__(self, name, parameters):
         super().__init__(name)
         self.parameters: List[ExpressionNode] = parameters
 
 
 class BinaryNode(ExpressionNode):
+    __slots__ = ('left', 'right')
+
     def __init__(self, left, right):
         self.left: ExpressionNode = left
         self.right: ExpressionNode = right
 
 
 class UnaryNode(ExpressionNode):
+    __slots__ = ('child',)
+
     def __init__(self, child):
         self.child: ExpressionNode = child
 
 
 class AtomicNode(ExpressionNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name: LexerToken = name
 
 
 class InstancePropertyNode(AtomicNode):
+    __slots__ = ('property',)
+
     def __init__(self, name, p_name):
         super().__init__(name)
         self.property: LexerToken = p_name
 
 
 class InstanceFunctionNode(ExpressionNode):
+    __slots__ = ('property', 'expression')
+
     def __init__(self, expression: ExpressionNode, expression_call: 'ExpressionCallNode'):
         self.property: ExpressionCallNode = expression_call
         self.expression: ExpressionNode = expression
 
 
 class ExpressionCallNode(AtomicNode):
+    __slots__ = ('parameters',)
+
     def __init__(self, name, parameters):
         super().__init__(name)
         self.parameters: List[ExpressionNode] = parameters
 
 
 class ArrayCallNode(ExpressionNode):
+    __slots__ = ('expression', 'indexer')
+
     def __init__(self, expression: ExpressionNode, indexer: ExpressionNode):
         self.expression: ExpressionNode = expression
         self.indexer: ExpressionNode = indexer
 
 
 class ConstantNode(AtomicNode):
+    __slots__ = ('value',)
+
     def __init__(self, value, v_type):
         super().__init__(value)
         self.value: LexerToken = value
@@ -138,41 +176,55 @@ class ConstantNode(AtomicNode):
 
 
 class StringBinaryNode(BinaryNode):
+    __slots__ = ('operator',)
+
     def __init__(self, left, right, operator):
         super().__init__(left, right)
         self.operator: StringOperator = operator
 
 
 class ArithmeticBinaryNode(BinaryNode):
+    __slots__ = ('operator',)
+
     def __init__(self, left, right, operator):
         super().__init__(left, right)
         self.operator: ArithmeticOperator = operator
 
 
 class ArithmeticUnaryNode(UnaryNode):
+    __slots__ = ('operator',)
+
     def __init__(self, child, operator):
         super().__init__(child)
         self.operator: ArithmeticOperator = operator
 
 
 class BooleanBinaryNode(BinaryNode):
+    __slots__ = ('operator',)
+
     def __init__(self, left, right, operator):
         super().__init__(left, right)
         self.operator: BooleanOperator = operator
 
 
 class BooleanUnaryNode(UnaryNode):
+    __slots__ = ('operator',)
+
     def __init__(self, child, operator):
         super().__init__(child)
         self.operator: BooleanOperator = operator
 
 
 class ArrayDeclarationNode(ExpressionNode):
+    __slots__ = ('type_',)
+
     def __init__(self):
         self.type_: Type
 
 
 class ImplicitArrayDeclarationNode(ArrayDeclarationNode):
+    __slots__ = ('expression', 'item', 'iterable')
+
     def __init__(self, expression, item, iterable):
         self.expression: ExpressionNode = expression
         self.item: LexerToken = item
@@ -180,11 +232,15 @@ class ImplicitArrayDeclarationNode(ArrayDeclarationNode):
 
 
 class ExplicitArrayDeclarationNode(ArrayDeclarationNode):
+    __slots__ = ('values',)
+
     def __init__(self, values: List[ExpressionNode]):
         self.values: List[ExpressionNode] = values
 
 
 class FunctionDeclarationNode(InstructionNode):
+    __slots__ = ('name', 'parameters', 'return_type', 'body')
+
     def __init__(self, name, parameters, return_type, body):
         self.name: LexerToken = name
         self.parameters: List[ParameterNode] = parameters
@@ -193,6 +249,8 @@ class FunctionDeclarationNode(InstructionNode):
 
 
 class ProtocolDeclarationNode(InstructionNode):
+    __slots__ = ('protocol_type', 'extension', 'body')
+
     def __init__(self, protocol_type, extension, body):
         self.protocol_type: ProtocolTypeNode = protocol_type
         self.extension: ExtensionNode = extension
@@ -200,6 +258,8 @@ class ProtocolDeclarationNode(InstructionNode):
 
 
 class ClassDeclarationNode(InstructionNode):
+    __slots__ = ('class_type', 'inheritance', 'body')
+
     def __init__(self, class_type, inheritance, body):
         self.class_type: ClassTypeNode | ClassDeclarationNode = class_type
         self.inheritance: InheritanceNode = inheritance
@@ -207,19 +267,23 @@ class ClassDeclarationNode(InstructionNode):
 
 
 class TypedInstructionNode(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name: LexerToken) -> None:
         self.name: LexerToken = name
 
 
 class ClassInstructionNode(TypedInstructionNode):
-    pass
+    __slots__ = ()
 
 
 class ProtocolInstructionNode(TypedInstructionNode):
-    pass
+    __slots__ = ()
 
 
 class ProtocolFunctionNode(ProtocolInstructionNode):
+    __slots__ = ('parameters', 'type')
+
     def __init__(self, name, parameters, p_type):
         super().__init__(name)
         self.parameters: List[ParameterNode] = parameters
@@ -227,6 +291,8 @@ class ProtocolFunctionNode(ProtocolInstructionNode):
 
 
 class ClassFunctionNode(ClassInstructionNode):
+    __slots__ = ('parameters', 'type', 'body')
+
     def __init__(self, name, parameters, p_type, body):
         super().__init__(name)
         self.parameters: List[ParameterNode] = parameters
@@ -235,6 +301,8 @@ class ClassFunctionNode(ClassInstructionNode):
 
 
 class ClassPropertyNode(ClassInstructionNode):
+    __slots__ = ('type', 'expression')
+
     def __init__(self, name, p_type, expression):
         super().__init__(name)
         self.type: TypeNode = p_type
@@ -242,23 +310,31 @@ class ClassPropertyNode(ClassInstructionNode):
 
 
 class IsNode(ExpressionNode):
+    __slots__ = ('expression', 'type_name')
+
     def __init__(self, expression, type_name):
         self.expression: ExpressionNode = expression
         self.type_name: TypeNode = type_name
 
 
 class AsNode(ExpressionNode):
+    __slots__ = ('expression', 'type_name')
+
     def __init__(self, expression, type_name):
         self.expression: ExpressionNode = expression
         self.type_name: TypeNode = type_name
 
 
 class NewNode(ExpressionNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name: ExpressionCallNode = name
 
 
 class DeclarationNode(ASTNode):
+    __slots__ = ('name', 'type', 'value')
+
     def __init__(self, name, p_type, value):
         self.name: LexerToken = name
         self.type: TypeNode = p_type
@@ -266,12 +342,16 @@ class DeclarationNode(ASTNode):
 
 
 class AssignmentNode(ExpressionNode):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name: LexerToken, value: ExpressionNode):
         self.name: LexerToken = name
         self.value: ExpressionNode = value
 
 
 class AssignmentPropertyNode(ExpressionNode):
+    __slots__ = ('name', 'property', 'value')
+
     def __init__(self, name: LexerToken, p_name: LexerToken, value: ExpressionNode) -> None:
         self.name: LexerToken = name
         self.property: LexerToken = p_name
@@ -279,18 +359,24 @@ class AssignmentPropertyNode(ExpressionNode):
 
 
 class AssignmentArrayNode(ExpressionNode):
+    __slots__ = ('array_call', 'value')
+
     def __init__(self, array_call: ArrayCallNode, value: ExpressionNode) -> None:
         self.array_call: ArrayCallNode = array_call
         self.value: ExpressionNode = value
 
 
 class LetNode(ExpressionNode):
+    __slots__ = ('assignments', 'body')
+
     def __init__(self, assignments: List[DeclarationNode], body):
         self.assignments: List[DeclarationNode] = assignments
         self.body: ExpressionNode = body
 
 
 class IfNode(ExpressionNode):
+    __slots__ = ('condition', 'body', 'elif_clauses', 'else_body')
+
     def __init__(self, condition, body, elif_clauses, else_body):
         self.condition: ExpressionNode = condition
         self.body: ExpressionNode = body
@@ -299,18 +385,24 @@ class IfNode(ExpressionNode):
 
 
 class ElifNode(ExpressionNode):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition: ExpressionNode = condition
         self.body: ExpressionNode = body
 
 
 class WhileNode(ExpressionNode):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition: ExpressionNode = condition
         self.body: ExpressionNode = body
 
 
 class ForNode(ExpressionNode):
+    __slots__ = ('variable', 'iterable', 'body')
+
     def __init__(self, variable: LexerToken, iterable: ExpressionNode, body):
         self.variable: LexerToken = variable
         self.iterable: ExpressionNode = iterable
@@ -318,6 +410,8 @@ class ForNode(ExpressionNode):
 
 
 class ExpressionBlockNode(ExpressionNode):
+    __slots__ = ('instructions',)
+
     def __init__(self, instructions: List[ASTNode]) -> None:
         self.instructions: List[ExpressionNode] = instructions
 
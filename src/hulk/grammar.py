@@ -1,4 +1,5 @@
-from compiler.attributed_grammar import AttributedGrammar, AttributedRule
+from compiler.attributed_grammar import AttributedGrammar, AttributedRule, IdentityRule
+from compiler.grammar import LEFT, RIGHT, NONASSOC
 from hulk.ast import *
 
 hulk_grammar = AttributedGrammar()
@@ -8,7 +9,7 @@ hulk_grammar.add_main('P')
 empty_list = AttributedRule[ASTNode, LexerToken](lambda _, s: [])
 first_list = AttributedRule[ASTNode, LexerToken](lambda _, s: [s[1]])
 
-first = AttributedRule[ASTNode, LexerToken](lambda _, s: s[1])
+first = IdentityRule[ASTNode, LexerToken]()
 second = AttributedRule[ASTNode, LexerToken](lambda _, s: s[2])
 
 # program productions
@@ -54,29 +55,33 @@ hulk_grammar.add_attributed_production('E', ['ES', 'EB'], [first, first])
 hulk_grammar.add_attributed_production(
     'ES', ['Es', 'El', 'Eif', 'Ew', 'Ef', 'Eas', 'Ear'], [first, first, first, first, first, first, first])
 
+# operator precedences, from the loosest to the tightest
+hulk_grammar.add_precedence(LEFT, ['|'])
+hulk_grammar.add_precedence(LEFT, ['&'])
+hulk_grammar.add_precedence(RIGHT, ['!'])
+hulk_grammar.add_precedence(NONASSOC, ['==', '!=', '<', '>', '>=', '<='])
+hulk_grammar.add_precedence(LEFT, ['+', '-'])
+hulk_grammar.add_precedence(LEFT, ['*', '/', '%'])
+hulk_grammar.add_precedence(RIGHT, ['^', '**'])
+hulk_grammar.add_precedence(RIGHT, ['unary'])
+
 # string expression productions
 concat_str = AttributedRule[ASTNode, LexerToken](
     lambda h, s: StringBinaryNode(s[1], s[3], StringOperator.CONCAT))
 concat_str_space = AttributedRule[ASTNode, LexerToken](
     lambda h, s: StringBinaryNode(s[1], s[3], StringOperator.SPACED_CONCAT))
 hulk_grammar.add_attributed_production(
-    'Es', ['Es @ Ts', 'Es @@ Ts', 'Ts'], [concat_str, concat_str_space, first])
-
-hulk_grammar.add_attributed_production('Ts', ['Eb'], [first])
+    'Es', ['Es @ Eb', 'Es @@ Eb', 'Eb'], [concat_str, concat_str_space, first])
 
 # boolean expression productions
 or_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: BooleanBinaryNode(s[1], s[3], BooleanOperator.OR))
-hulk_grammar.add_attributed_production('Eb', ['Eb | Fb', 'Tb'], [or_op, first])
-
 and_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: BooleanBinaryNode(s[1], s[3], BooleanOperator.AND))
-hulk_grammar.add_attributed_production(
-    'Tb', ['Tb & Fb', 'Fb'], [and_op, first])
-
 not_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: BooleanUnaryNode(s[2], BooleanOperator.NOT))
-hulk_grammar.add_attributed_production('Fb', ['! Cb', 'Cb'], [not_op, first])
+hulk_grammar.add_attributed_production(
+    'Eb', ['Eb | Eb', 'Eb & Eb', '! Eb'], [or_op, and_op, not_op])
 
 eq_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: BooleanBinaryNode(s[1], s[3], BooleanOperator.EQ))
@@ -91,41 +96,32 @@ gte_op = AttributedRule[ASTNode, LexerToken](
 lte_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: BooleanBinaryNode(s[1], s[3], BooleanOperator.LTE))
 hulk_grammar.add_attributed_production(
-    'Cb', ['Gb == Gb', 'Gb != Gb', 'Gb < Gb', 'Gb > Gb', 'Gb >= Gb', 'Gb <= Gb', 'Gb'],
-    [eq_op, neq_op, lt_op, gt_op, gte_op, lte_op, first])
-
-hulk_grammar.add_attributed_production('Gb', ['Ea'], [first])
+    'Eb', ['Eb == Eb', 'Eb != Eb', 'Eb < Eb', 'Eb > Eb', 'Eb >= Eb', 'Eb <= Eb'],
+    [eq_op, neq_op, lt_op, gt_op, gte_op, lte_op])
 
 # arithmetic expression productions
 add_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticBinaryNode(s[1], s[3], ArithmeticOperator.ADD))
 sub_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticBinaryNode(s[1], s[3], ArithmeticOperator.SUB))
-hulk_grammar.add_attributed_production(
-    'Ea', ['Ea + Ta', 'Ea - Ta', 'Ta'], [add_op, sub_op, first])
-
 mul_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticBinaryNode(s[1], s[3], ArithmeticOperator.MUL))
 div_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticBinaryNode(s[1], s[3], ArithmeticOperator.DIV))
 mod_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticBinaryNode(s[1], s[3], ArithmeticOperator.MOD))
-hulk_grammar.add_attributed_production(
-    'Ta', ['Ta * Fa', 'Ta / Fa', 'Ta % Fa', 'Fa'], [mul_op, div_op, mod_op, first])
-
 pow_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticBinaryNode(s[1], s[3], ArithmeticOperator.POW))
 hulk_grammar.add_attributed_production(
-    'Fa', ['Ga ^ Fa', 'Ga ** Fa', 'Ga'], [pow_op, pow_op, first])
+    'Eb', ['Eb + Eb', 'Eb - Eb', 'Eb * Eb', 'Eb / Eb', 'Eb % Eb', 'Eb ^ Eb', 'Eb ** Eb'],
+    [add_op, sub_op, mul_op, div_op, mod_op, pow_op, pow_op])
 
 plus_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticUnaryNode(s[2], ArithmeticOperator.ADD))
 minus_op = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ArithmeticUnaryNode(s[2], ArithmeticOperator.SUB))
 hulk_grammar.add_attributed_production(
-    'Ga', ['+ Oa', '- Oa', 'Oa'], [plus_op, minus_op, first])
-
-hulk_grammar.add_attributed_production('Oa', ['W'], [first])
+    'Eb', ['+ Eb %prec unary', '- Eb %prec unary', 'W'], [plus_op, minus_op, first])
 
 num_c = AttributedRule[ASTNode, LexerToken](
     lambda h, s: ConstantNode(s[1], ConstantTypes.NUMBER))
@@ -1,18 +1,14 @@
 import subprocess
-from .lexer import hulk_lexer_build
-from .parser import hulk_parser_build, hulk_parse, hulk_to_grammar
-from compiler.lexer import Lexer
-from .grammar import hulk_grammar
+from .lexer import hulk_lexer_build, hulk_lexer_load
+from .parser import hulk_parser_build, hulk_evaluate, hulk_parse, hulk_to_grammar
 from .code_generator import code_generator
 from hulk.semanticCheck import hulk_semantic_check
 
-def build() -> bool:
-    hulk_lexer_build()
-    return hulk_parser_build()
+def build(force: bool = False) -> bool:
+    return hulk_lexer_build(force) and hulk_parser_build(force)
 
 def compiler(program: str) -> bool:
-    hulk_lexer = Lexer()
-    hulk_lexer.load('hulk')
+    hulk_lexer = hulk_lexer_load()
 
     result = hulk_lexer.run(program)
     tokens = result.tokens
@@ -21,13 +17,15 @@ def compiler(program: str) -> bool:
         print(f'Error: {result.error}')
         return False
 
-    result = hulk_parse([hulk_to_grammar(t) for t in tokens])
+    result = hulk_evaluate(tokens)
 
     if not result.ok:
-        print(f'Error: {result.error}')
+        # parse again with recovery to report every syntax error at once
+        result = hulk_parse([hulk_to_grammar(t) for t in tokens], recover=True)
+        print(f'Error: {result.errors}')
         return False
 
-    ast = hulk_grammar.evaluate(result.derivation_tree,tokens)
+    ast = result.value
     result = hulk_semantic_check(ast)
 
     if not result.ok:
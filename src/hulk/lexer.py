@@ -1,5 +1,8 @@
 from regex.regex import Regex
+from regex.regex_grammar import regex_grammar
 from hulk.constants import *
+from compiler.automatonSLR1 import AutomatonSLR1
+from compiler.fingerprint import fingerprint, source_fingerprint
 from compiler.lexer import Lexer
 
 
@@ -7,7 +10,21 @@ def get_special_token_pattern(token: str) -> str:
     return "".join([f'\\{t}' for t in token])
 
 
-def hulk_lexer_build() -> bool:
+def hulk_lexer_fingerprint() -> str:
+    # the lexer depends on the token constants, the patterns below, the
+    # regex engine that compiles them and the table it parses them with
+    modules = ['hulk.constants', __name__, 'compiler.lexer', 'compiler.automaton',
+               'regex.regex', 'regex.regex_ast', 'regex.regex_core', 'regex.regex_lexer']
+
+    return fingerprint(source_fingerprint(modules), AutomatonSLR1.get_fingerprint(regex_grammar))
+
+
+def hulk_lexer_build(force: bool = False) -> bool:
+    stamp = hulk_lexer_fingerprint()
+
+    if not force and Lexer.get_fingerprint('hulk') == stamp:
+        return True
+
     RESERVED_WORDS.sort(key=lambda x: len(x), reverse=True)
     NUMERIC_CONSTANTS.sort(key=lambda x: len(x), reverse=True)
     DEFINED_FUNCTIONS.sort(key=lambda x: len(x), reverse=True)
@@ -37,10 +54,15 @@ def hulk_lexer_build() -> bool:
 
     tokens_automaton = [(t, r.automaton) for t, r in tokens_regex]
 
-    Lexer().build('hulk', tokens_automaton, ignore_regex.automaton)
+    Lexer().build('hulk', tokens_automaton, ignore_regex.automaton, stamp)
+
+    return True
 
 
 def hulk_lexer_load() -> Lexer:
+    # a lexer stale for the current constants or builder is rebuilt
+    hulk_lexer_build()
+
     hulk_lexer = Lexer()
     hulk_lexer.load('hulk')
 
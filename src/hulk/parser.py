@@ -1,40 +1,68 @@
 from typing import List
 
-from compiler.automatonLR1 import AutomatonLR1
+from compiler.automatonLALR1 import AutomatonLALR1
 from compiler.grammar import GrammarToken
 from compiler.lexer import LexerToken
-from compiler.parser import Parser, ParseResult
+from compiler.parser import Parser, ParseResult, PushParser, IncrementalParser
 from compiler.tableLR import TableLR
 from hulk.constants import *
 from .grammar import hulk_grammar
 
 
-def hulk_parser_build() -> bool:
-    a = AutomatonLR1('hulk', hulk_grammar)
+def hulk_parser_build(force: bool = False) -> bool:
+    if not force and AutomatonLALR1.is_up_to_date('hulk', hulk_grammar):
+        return True
+
+    a = AutomatonLALR1('hulk', hulk_grammar)
+
+    for conflict in a.conflicts:
+        print(f'Conflict: {conflict}')
+
     return a.ok
 
 
-def hulk_parse(tokens: List[GrammarToken]) -> ParseResult:
-    t = TableLR(hulk_grammar)
-    t.load('hulk')
+def hulk_parser_load() -> TableLR:
+    return TableLR.load_shared('hulk', hulk_grammar, hulk_parser_build)
+
+
+# terminals the parser resynchronizes on after a syntax error
+SYNC_TOKENS = [';', '}']
+
+
+def hulk_parse(tokens: List[GrammarToken], recover: bool = False) -> ParseResult:
+    p = Parser(hulk_grammar, hulk_parser_load())
+    sync = [hulk_grammar.get_token(t) for t in SYNC_TOKENS] if recover else None
+
+    return p.parse(tokens, sync)
+
+
+def hulk_evaluate(tokens: List[LexerToken]) -> ParseResult:
+    # parses and builds the AST in the same pass, the result is its `value`
+    p = Parser(hulk_grammar, hulk_parser_load())
+
+    return p.evaluate([hulk_to_grammar(t) for t in tokens], tokens)
+
+
+def hulk_push_parser() -> PushParser:
+    return PushParser(hulk_grammar, hulk_parser_load())
 
-    p = Parser(hulk_grammar, t)
 
-    return p.parse(tokens)
+def hulk_incremental_parser() -> IncrementalParser:
+    return IncrementalParser(hulk_grammar, hulk_parser_load())
 
 
 def hulk_to_grammar(token: LexerToken) -> GrammarToken:
     if token.value in SPECIAL_TOKENS or token.value in RESERVED_WORDS:
-        return GrammarToken(token.value, True)
+        return hulk_grammar.get_token(token.value)
 
     if token.type == STRING:
-        return GrammarToken('str', True)
+        return hulk_grammar.get_token('str')
 
     if token.type == NUMBER:
-        return GrammarToken('num', True)
+        return hulk_grammar.get_token('num')
 
     if token.type == IDENTIFIER:
-        return GrammarToken('id', True)
+        return hulk_grammar.get_token('id')
 
     if token.type == BOOLEAN:
-        return GrammarToken('bool', True)
+        return hulk_grammar.get_token('bool')
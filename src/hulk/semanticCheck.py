@@ -135,6 +135,7 @@ class TypeBuilder(object):
             self.check_extends()
             self.implement_protocols()
             self.collect_vectors()
+            self.context.freeze_hierarchy()
 
     @visitor.when(FunctionDeclarationNode)
     def visit(self, node: FunctionDeclarationNode):
@@ -1,6 +1,7 @@
+import weakref
 from abc import ABC
 from collections import OrderedDict
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from compiler.lexer import LexerToken
 
@@ -72,10 +73,64 @@ class Method:
 class Type(ABC):
     def __init__(self, name: str):
         self.name = name
+        # flattened inherited members, dropped when this type or one of its
+        # ancestors changes. Subtypes are held weakly (by identity, since
+        # types compare by name) so builtins do not keep every compiled
+        # program's types alive
+        self._subtypes: weakref.WeakValueDictionary[int, Type] = weakref.WeakValueDictionary()
+        self._attribute_table = None
+        self._method_table = None
+        self._parent: Type = None
         self.attributes: List[Attribute] = []
         self.methods: List[Method] = []
         self.parent: Type = None
 
+    @property
+    def attributes(self) -> List[Attribute]:
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: List[Attribute]) -> None:
+        self._attributes = []
+        self._attribute_index: Dict[str, Attribute] = {}
+        for attribute in attributes:
+            self.add_attribute(attribute)
+
+    @property
+    def methods(self) -> List[Method]:
+        return self._methods
+
+    @methods.setter
+    def methods(self, methods: List[Method]) -> None:
+        self._methods = []
+        self._method_index: Dict[str, Method] = {}
+        for method in methods:
+            self.add_method(method)
+
+    @property
+    def parent(self) -> 'Type':
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: 'Type') -> None:
+        if self._parent is not None:
+            self._parent._subtypes.pop(id(self), None)
+        if parent is not None:
+            parent._subtypes[id(self)] = self
+        self._parent = parent
+        self.__invalidate()
+
+    def __invalidate(self) -> None:
+        # inheritance may still be circular while types are being built
+        pending, seen = [self], set()
+        while pending:
+            t = pending.pop()
+            if id(t) in seen:
+                continue
+            seen.add(id(t))
+            t._attribute_table = t._method_table = None
+            pending.extend(t._subtypes.values())
+
     def decompact(self, token: LexerToken):
         return (token.row, token.col, token.value)
 
@@ -90,83 +145,105 @@ class Type(ABC):
     def get_attribute(self, id: LexerToken) -> Attribute:
         row, col, name = self.decompact(id)
         try:
-            return next(attr for attr in self.attributes if attr.name == name)
-        except StopIteration:
-            if self.parent is None:
-                raise SemanticError(
-                    f'Attribute "{name}" is not defined in {self.name}.' + self.error_location(row, col))
-            try:
-                return self.parent.get_attribute(id)
-            except SemanticError:
-                raise SemanticError(
-                    f'Attribute "{name}" is not defined in {self.name}.' + self.error_location(row, col))
+            return self.__attribute_table()[0][name]
+        except KeyError:
+            raise SemanticError(
+                f'Attribute "{name}" is not defined in {self.name}.' + self.error_location(row, col))
 
     def define_attribute(self, id: LexerToken, typex: 'Type') -> Attribute:
         row, col, name = self.decompact(id)
-        if name in (attribute.name for attribute in self.attributes):
+        if name in self._attribute_index:
             raise SemanticError(
                 f'Attribute "{name}" already defined in {self.name}' + self.error_location(row, col))
 
         attribute = Attribute(name, typex)
-        self.attributes.append(attribute)
+        self.add_attribute(attribute)
         return attribute
 
     def add_attribute(self, attribute: Attribute):
-        self.attributes.append(attribute)
+        self._attributes.append(attribute)
+        self._attribute_index.setdefault(attribute.name, attribute)
+        self.__invalidate()
 
     def get_method(self, name: str) -> Method:
         try:
-            return next(method for method in self.methods if method.name == name)
-        except StopIteration:
-            if self.parent is None:
-                raise SemanticError(
-                    f'Method "{name}" is not defined in {self.name}.')
-            try:
-                return self.parent.get_method(name)
-            except SemanticError:
-                raise SemanticError(
-                    f'Method "{name}" is not defined in {self.name}.')
+            return self.__method_table()[0][name]
+        except KeyError:
+            raise SemanticError(
+                f'Method "{name}" is not defined in {self.name}.')
 
     def define_method(self, id: LexerToken, arguments: List[Attribute], return_type: 'Type') -> Method:
         row, col, name = self.decompact(id)
-        if name in (method.name for method in self.methods):
+        if name in self._method_index:
             raise SemanticError(
                 f'Method "{name}" already defined in {self.name}' + self.error_location(row, col))
 
         method = Method(name, return_type, arguments)
-        self.methods.append(method)
+        self.add_method(method)
         return method
 
     def add_method(self, method: Method):
-        self.methods.append(method)
+        self._methods.append(method)
+        self._method_index.setdefault(method.name, method)
+        self.__invalidate()
+
+    def __attribute_table(self):
+        table = self._attribute_table
+        if table is None:
+            table = self._attribute_table = self.__flatten(
+                'attributes', self._attribute_index)
+        return table
+
+    def __method_table(self):
+        table = self._method_table
+        if table is None:
+            lookup, plain = self.__flatten('methods', self._method_index)
+            signatures = {(m.name, len(m.arguments)): m for m, _ in plain.values()}
+            table = self._method_table = (lookup, plain, signatures)
+        return table
+
+    def __flatten(self, kind: str, index: Dict[str, object]):
+        # (lookup by name, members in declaration order with their owner),
+        # the inherited part is copied from the parent table
+        if self.parent is None:
+            lookup, plain = {}, OrderedDict()
+        else:
+            inherited = self.parent.__attribute_table() if kind == 'attributes' \
+                else self.parent.__method_table()
+            lookup, plain = dict(inherited[0]), OrderedDict(inherited[1])
+
+        lookup.update(index)
+        for member in getattr(self, kind):
+            plain[member.name] = (member, self)
+        return lookup, plain
+
+    def method_names(self):
+        return self._method_index.keys()
+
+    def has_methods(self, names) -> bool:
+        return names <= self.__method_table()[1].keys()
+
+    def get_method_signature(self, name: str, arity: int) -> Method | None:
+        return self.__method_table()[2].get((name, arity))
 
     def all_attributes(self, clean=True) -> List[Tuple[Attribute, 'Type']]:
-        plain = OrderedDict() if self.parent is None else self.parent.all_attributes(False)
-        for attr in self.attributes:
-            plain[attr.name] = (attr, self)
-        return plain.values() if clean else plain
+        plain = self.__attribute_table()[1]
+        return plain.values() if clean else OrderedDict(plain)
 
     def all_methods(self, clean=True) -> List[Tuple[Method, 'Type']]:
-        plain = OrderedDict() if self.parent is None else self.parent.all_methods(False)
-        for method in self.methods:
-            plain[method.name] = (method, self)
-        return plain.values() if clean else plain
+        plain = self.__method_table()[1]
+        return plain.values() if clean else OrderedDict(plain)
 
     def check_overriding(self, clean=True):
-        plain = OrderedDict() if self.parent is None else self.parent.all_methods(False)
+        inherited = {} if self.parent is None else self.parent.__method_table()[1]
+        own = {}
         for method in self.methods:
-            if method.name == 'init':
-                plain[method.name] = (method, self)
-            else:
-                try:
-                    m, _ = plain[method.name]
-                    if not method.is_overriding(m):
-                        raise SemanticError(
-                            f'Function "{method.name}" is wrongly overriding')
-                    else:
-                        plain[method.name] = (method, self)
-                except KeyError:
-                    plain[method.name] = (method, self)
+            if method.name != 'init':
+                m = own.get(method.name, inherited.get(method.name))
+                if m is not None and not method.is_overriding(m[0]):
+                    raise SemanticError(
+                        f'Function "{method.name}" is wrongly overriding')
+            own[method.name] = (method, self)
 
     def conforms_to(self, other: 'Type') -> bool:
         if self == other:
@@ -177,7 +254,6 @@ class Type(ABC):
 
     @staticmethod
     def low_common_ancestor(t1: 'Type', t2: 'Type') -> 'Type':
-        ERROR = Type('Error')
         if t1 is None and t2 is None:
             return ERROR
         elif t1 is None:
@@ -197,7 +273,7 @@ class Type(ABC):
         t = self.parent
 
         while t is not None:
-            if any(m for m in t.methods if m.name == name):
+            if name in t._method_index:
                 return t
             t = t.parent
 
@@ -226,6 +302,9 @@ class Type(ABC):
         return hash(self.name)
 
 
+ERROR = Type('Error')
+
+
 class Protocol(Type):
     def __init__(self, name: str) -> None:
         super().__init__(name)
@@ -264,18 +343,16 @@ class Class(Type):
         self.parent = inherits
 
     def implement_protocol(self, protocol: Protocol) -> bool:
+        if not self.has_methods(protocol.method_names()):
+            return False
+
         for mp in protocol.methods:
-            finded = False
-            class_methods = self.all_methods()
-            for mc, _ in class_methods:
-                if mc.name == mp.name and len(mc.arguments) == len(mp.arguments):
-                    if mc.return_type is None or any([a for a in mc.arguments if a.type is None]):
-                        continue
-                    if mc.return_type.conforms_to(mp.return_type):
-                        if all([ap.type.conforms_to(ac.type) for ap, ac in zip(mp.arguments, mc.arguments)]):
-                            finded = True
-                            break
-            if not finded:
+            mc = self.get_method_signature(mp.name, len(mp.arguments))
+            if mc is None or mc.return_type is None or any(a.type is None for a in mc.arguments):
+                return False
+            if not mc.return_type.conforms_to(mp.return_type):
+                return False
+            if not all(ap.type.conforms_to(ac.type) for ap, ac in zip(mp.arguments, mc.arguments)):
                 return False
         return True
 
@@ -303,3 +380,97 @@ class Class(Type):
         output += '\n' if self.protocols else ''
         output += '}\n'
         return output
+
+
+class TypeHierarchy:
+    # frozen subtype relation of a set of types and their ancestors. Every
+    # type gets the bitset of the type and protocol names it conforms to,
+    # and classes get depth and binary lifting tables for least common
+    # ancestors. Types created after the index fall back to the Type methods
+
+    def __init__(self, types: List[Type]) -> None:
+        self.index: Dict[int, int] = {}
+        self.types: List[Type] = []
+        self.names: Dict[str, int] = {}
+
+        for t in types:
+            while t is not None and id(t) not in self.index:
+                self.index[id(t)] = len(self.types)
+                self.types.append(t)
+                t = t.parent
+
+        n = len(self.types)
+        parent = [-1 if t.parent is None else self.index[id(t.parent)]
+                  for t in self.types]
+
+        # ancestors before descendants, so every row only extends its parent
+        order: List[int] = []
+        depth = [-1] * n
+        for i in range(n):
+            chain = []
+            while i != -1 and depth[i] == -1:
+                chain.append(i)
+                i = parent[i]
+            d = 0 if i == -1 else depth[i] + 1
+            for j in reversed(chain):
+                depth[j] = d
+                order.append(j)
+                d += 1
+
+        self.depth: List[int] = depth
+        self.masks: List[int] = [0] * n
+        self.roots: List[int] = list(range(n))
+
+        for i in order:
+            t = self.types[i]
+            mask = self.__bit(t.name)
+            if parent[i] != -1:
+                mask |= self.masks[parent[i]]
+                self.roots[i] = self.roots[parent[i]]
+            for p in getattr(t, 'protocols', []):
+                mask |= self.__bit(p.name)
+            self.masks[i] = mask
+
+        # up[k][i] is the 2^k-th ancestor of i, roots are their own ancestors
+        self.up: List[List[int]] = [
+            [i if p == -1 else p for i, p in enumerate(parent)]]
+        for _ in range(max(depth, default=0).bit_length() - 1):
+            prev = self.up[-1]
+            self.up.append([prev[prev[i]] for i in range(n)])
+
+    def __bit(self, name: str) -> int:
+        return 1 << self.names.setdefault(name, len(self.names))
+
+    def conforms(self, t: Type, other: Type) -> bool:
+        i = self.index.get(id(t))
+        if i is None:
+            return t.conforms_to(other)
+        b = self.names.get(other.name)
+        return b is not None and (self.masks[i] >> b) & 1 == 1
+
+    def low_common_ancestor(self, t1: Type, t2: Type) -> Type:
+        i = None if t1 is None else self.index.get(id(t1))
+        j = None if t2 is None else self.index.get(id(t2))
+
+        # walking both parents in lockstep meets at the tree ancestor only
+        # when the two classes share an inheritance tree
+        if i is None or j is None or self.roots[i] != self.roots[j] or \
+                not isinstance(t1, Class) or not isinstance(t2, Class):
+            return Type.low_common_ancestor(t1, t2)
+
+        depth, up = self.depth, self.up
+        if depth[i] < depth[j]:
+            i, j = j, i
+        diff = depth[i] - depth[j]
+        k = 0
+        while diff:
+            if diff & 1:
+                i = up[k][i]
+            diff >>= 1
+            k += 1
+        if i == j:
+            return self.types[i]
+        for k in range(len(up) - 1, -1, -1):
+            if up[k][i] != up[k][j]:
+                i, j = up[k][i], up[k][j]
+        return self.types[up[0][i]]
@@ -12,6 +12,12 @@ class Context:
         self.types: Dict[str, Class] = {}
         self.protocols: Dict[str, Type] = {}
         self.methods: Dict[str, Method] = {}
+        self.hierarchy: TypeHierarchy = TypeHierarchy([])
+
+    def freeze_hierarchy(self) -> TypeHierarchy:
+        self.hierarchy = TypeHierarchy(
+            list(self.types.values()) + list(self.protocols.values()))
+        return self.hierarchy
 
     def decompact(self, token: LexerToken):
         return (token.row, token.col, token.value)
@@ -91,6 +97,7 @@ class Context:
 class SemanticGraph:
     def __init__(self, context: Context):
         self.context: Context = context
+        self.hierarchy: TypeHierarchy = context.hierarchy
         self.adj: List[List[int]] = []
         self.nodes: List[SemanticNode] = []
         self.index: int = 0
@@ -127,7 +134,7 @@ class SemanticGraph:
             for child in self.get_children(node):
                 if not child.visited:
                     self.dfs(child)
-                children_type = Type.low_common_ancestor(
+                children_type = self.hierarchy.low_common_ancestor(
                     children_type, child.node_type)
             return children_type
 
@@ -146,7 +153,7 @@ class SemanticGraph:
                 if child.node_type is None:
                     child.node_type = node.node_type
                     continue
-                if child.node_type == self.ERROR or not child.node_type.conforms_to(node.node_type):
+                if child.node_type == self.ERROR or not self.hierarchy.conforms(child.node_type, node.node_type):
                     node.node_type = self.ERROR
                     break
 
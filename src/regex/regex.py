@@ -3,9 +3,8 @@ from typing import List
 from compiler.automaton import Automaton
 from .regex_ast import RegexAst
 from .regex_core import RegexResult, RegexToken
-from .regex_grammar import regex_grammar
 from .regex_lexer import lexer
-from .regex_parser import regex_parser, regex_to_grammar
+from .regex_parser import regex_evaluate
 
 
 class Regex():
@@ -33,9 +32,9 @@ class Regex():
         return lexer(text)
 
     def __parser(self, tokens: List[RegexToken]) -> RegexResult[RegexAst]:
-        result = regex_parser([regex_to_grammar(t) for t in tokens])
+        result = regex_evaluate(tokens)
 
         if not result.ok:
             return RegexResult[RegexAst](error=result.error)
 
-        return RegexResult[RegexAst](regex_grammar.evaluate(result.derivation_tree, tokens))
+        return RegexResult[RegexAst](result.value)
@@ -1,4 +1,4 @@
-from compiler.attributed_grammar import AttributedGrammar, AttributedRule
+from compiler.attributed_grammar import AttributedGrammar, AttributedRule, IdentityRule
 from .regex_ast import *
 from .regex_core import RegexToken
 
@@ -7,13 +7,13 @@ regex_special_tokens = ['?', '+', '*', '^',
 
 regex_grammar = AttributedGrammar()
 
-r0 = AttributedRule[RegexAst, RegexToken](lambda _, s: s[1])
+r0 = IdentityRule[RegexAst, RegexToken]()
 
 r1 = AttributedRule[RegexAst, RegexToken](lambda _, s: RegexOr(s[1], s[3]))
-r2 = AttributedRule[RegexAst, RegexToken](lambda _, s: s[1])
+r2 = IdentityRule[RegexAst, RegexToken]()
 
 r3 = AttributedRule[RegexAst, RegexToken](lambda _, s: RegexConcat(s[1], s[2]))
-r4 = AttributedRule[RegexAst, RegexToken](lambda _, s: s[1])
+r4 = IdentityRule[RegexAst, RegexToken]()
 
 r5 = AttributedRule[RegexAst, RegexToken](
     lambda _, s: s[4], [(3, lambda _, s: s[2])])
@@ -31,10 +31,10 @@ r12 = AttributedRule[RegexAst, RegexToken](lambda _, s: s[2])
 r13 = AttributedRule[RegexAst, RegexToken](lambda _, s: RegexAnyChar())
 
 r14 = AttributedRule[RegexAst, RegexToken](lambda _, s: RegexNot(s[2]))
-r15 = AttributedRule[RegexAst, RegexToken](lambda _, s: s[1])
+r15 = IdentityRule[RegexAst, RegexToken]()
 
 r16 = AttributedRule[RegexAst, RegexToken](lambda _, s: RegexOr(s[1], s[2]))
-r17 = AttributedRule[RegexAst, RegexToken](lambda _, s: s[1])
+r17 = IdentityRule[RegexAst, RegexToken]()
 
 r18 = AttributedRule[RegexAst, RegexToken](lambda _, s: RegexChar(s[1].value))
 r19 = AttributedRule[RegexAst, RegexToken](
@@ -9,19 +9,34 @@ from .regex_core import RegexToken
 from .regex_grammar import regex_grammar
 
 
-def regex_build() -> bool:
+def regex_build(force: bool = False) -> bool:
+    if not force and AutomatonSLR1.is_up_to_date('regex', regex_grammar):
+        return True
+
     a = AutomatonSLR1('regex', regex_grammar)
+
+    for conflict in a.conflicts:
+        print(f'Conflict: {conflict}')
+
     return a.ok
 
 
+def regex_parser_load() -> TableLR:
+    return TableLR.load_shared('regex', regex_grammar, regex_build)
+
+
 def regex_parser(l: List[GrammarToken]) -> ParseResult:
-    t = TableLR(regex_grammar)
-    t.load('regex')
-    return Parser(regex_grammar, t).parse(l)
+    return Parser(regex_grammar, regex_parser_load()).parse(l)
+
+
+def regex_evaluate(tokens: List[RegexToken]) -> ParseResult:
+    p = Parser(regex_grammar, regex_parser_load())
+
+    return p.evaluate([regex_to_grammar(t) for t in tokens], tokens)
 
 
 def regex_to_grammar(token: RegexToken) -> GrammarToken:
     if token.is_special:
-        return [t for t in regex_grammar.terminals if t.value == token.value][0]
+        return regex_grammar.get_token(token.value)
 
-    return [t for t in regex_grammar.terminals if t.value == 'ch'][0]
+    return regex_grammar.get_token('ch')
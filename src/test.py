@@ -3,10 +3,12 @@ import importlib
 test_modules = [
     'slr1',
     'lr1',
+    'lalr1',
     'tableLR',
     'regex',
     'lexer',
     'automaton',
+    'visitor',
     'hulk_grammar',
     'type_collector',
     'code_gen'
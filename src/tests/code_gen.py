@@ -1,9 +1,8 @@
 import subprocess
 from compiler.lexer import Lexer
 from hulk.code_generator import code_generator
-from hulk.parser import hulk_parse, hulk_to_grammar
+from hulk.parser import hulk_evaluate
 from hulk.semanticCheck import hulk_semantic_check
-from .hulk_grammar import hulk_grammar
 
 
 def hulk_compile_str(program: str) -> str:
@@ -18,14 +17,14 @@ def hulk_compile_str(program: str) -> str:
             f'Lexer error:\nrow {result.error.row+1} col {result.error.col+1}')
         return ''
 
-    result = hulk_parse([hulk_to_grammar(t) for t in result.tokens])
+    result = hulk_evaluate(tokens)
 
     if not result.ok:
         print(
             f'Parser error:\nrow {tokens[result.error-1].row+1} col {tokens[result.error-1].col+1}')
         return ''
 
-    ast = hulk_grammar.evaluate(result.derivation_tree, tokens)
+    ast = result.value
     result = hulk_semantic_check(ast)
 
     if not result.ok:
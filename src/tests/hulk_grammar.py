@@ -1,5 +1,6 @@
-from hulk.parser import hulk_to_grammar, hulk_parse
+from hulk.parser import hulk_to_grammar, hulk_parse, hulk_evaluate
 from compiler.lexer import Lexer
+from hulk.ast import ArithmeticBinaryNode, ArithmeticUnaryNode, ArithmeticOperator, ConstantNode
 from hulk.grammar import hulk_grammar
 
 
@@ -16,6 +17,14 @@ def hulk_compile_str(program: str):
     return result.ok
 
 
+def hulk_expression(program: str):
+    hulk_lexer = Lexer()
+    hulk_lexer.load('hulk')
+
+    result = hulk_evaluate(hulk_lexer.run(program).tokens)
+    return result.value.expression if result.ok else None
+
+
 def test():
     string_test =\
         """
@@ -226,3 +235,48 @@ def test():
     """
 
     assert hulk_compile_str(vector_type_test)
+
+    errors_test =\
+        """
+        function f(a) => a + ;
+        {
+            print(1 2);
+            print(3);
+            print(+);
+            let a = in a;
+        }
+    """
+
+    hulk_lexer = Lexer()
+    hulk_lexer.load('hulk')
+    tokens = hulk_lexer.run(errors_test).tokens
+    result = hulk_parse([hulk_to_grammar(t) for t in tokens], recover=True)
+
+    assert not result.ok
+    assert [(tokens[i].value, tokens[i].row) for i in result.errors] == \
+        [(';', 1), ('2', 3), (')', 5), ('in', 6)]
+    assert hulk_parse([hulk_to_grammar(t) for t in tokens]).errors == result.errors[:1]
+
+    # precedence and associativity of the merged expression levels
+    expression = hulk_expression('2 ^ 3 ^ 2;')
+    assert isinstance(expression, ArithmeticBinaryNode)
+    assert expression.operator == ArithmeticOperator.POW
+    assert isinstance(expression.left, ConstantNode)
+    assert isinstance(expression.right, ArithmeticBinaryNode)
+    assert expression.right.operator == ArithmeticOperator.POW
+
+    expression = hulk_expression('1 - 2 - 3;')
+    assert isinstance(expression, ArithmeticBinaryNode)
+    assert expression.operator == ArithmeticOperator.SUB
+    assert isinstance(expression.left, ArithmeticBinaryNode)
+    assert expression.left.operator == ArithmeticOperator.SUB
+    assert isinstance(expression.right, ConstantNode)
+
+    expression = hulk_expression('-2 ^ 2;')
+    assert isinstance(expression, ArithmeticBinaryNode)
+    assert expression.operator == ArithmeticOperator.POW
+    assert isinstance(expression.left, ArithmeticUnaryNode)
+    assert expression.left.operator == ArithmeticOperator.SUB
+
+    assert hulk_expression('a == b == c;') is None
+    assert hulk_expression('a == b & b == c;') is not None
@@ -0,0 +1,195 @@
+import random
+
+from compiler.attributed_grammar import AttributedGrammar, AttributedRule, IdentityRule
+from compiler.automatonLALR1 import AutomatonLALR1
+from compiler.automatonLR1 import AutomatonLR1
+from compiler.grammar import Grammar, LEFT, RIGHT, NONASSOC
+from compiler.parser import Parser, IncrementalParser
+from compiler.tableLR import TableLR
+
+
+def test():
+    g = Grammar()
+
+    g.add_main("S")
+    g.add_production("S", ["E"])
+    g.add_production("E", ["A = A", "i"])
+    g.add_production("A", ["i + A", "i"])
+
+    q = AutomatonLALR1('test1_lalr1', g)
+    q1 = AutomatonLR1('test1_lr1_cmp', g)
+
+    assert q.ok
+    assert len(q.nodes) < len(q1.nodes)
+
+    table = TableLR(g)
+    table.load('test1_lalr1')
+
+    p = Parser(g, table)
+
+    assert p.parse(p.str_to_tokens('i + i = i')).ok
+    assert p.parse(p.str_to_tokens('i')).ok
+    assert not p.parse(p.str_to_tokens('i = i + = i')).ok
+
+    g1 = Grammar()
+
+    g1.add_main("S")
+    g1.add_production("S", ["X"])
+    g1.add_production("X", ["a E c", "a F d", "b F c", "b E d"])
+    g1.add_production("E", ["e"])
+    g1.add_production("F", ["e"])
+
+    assert AutomatonLR1('test2_lr1_cmp', g1).ok
+
+    q2 = AutomatonLALR1('test2_lalr1', g1)
+
+    assert not q2.ok
+    assert len(q2.conflicts) > 0
+
+    g2 = AttributedGrammar[int, str]()
+
+    g2.add_main("S")
+    g2.add_attributed_production("S", ["E"], [IdentityRule()])
+    g2.add_attributed_production("E", ["E - E", "E ^ E", "- E %prec unary", "n"], [
+        AttributedRule(lambda _, s: s[1] - s[3]),
+        AttributedRule(lambda _, s: s[1] ** s[3]),
+        AttributedRule(lambda _, s: -s[2]),
+        AttributedRule(lambda _, s: int(s[1]))])
+
+    assert not AutomatonLALR1('test3_lalr1', g2).ok
+
+    g2.add_precedence(LEFT, ['-'])
+    g2.add_precedence(RIGHT, ['^'])
+    g2.add_precedence(NONASSOC, ['unary'])
+
+    q3 = AutomatonLALR1('test3_lalr1', g2)
+
+    assert q3.ok
+    assert len(q3.conflicts) == 0
+
+    table = TableLR(g2)
+    table.load('test3_lalr1')
+
+    p = Parser(g2, table)
+    q = p.parse(p.str_to_tokens('n - n - n'))
+
+    assert q.ok
+    assert g2.evaluate(q.derivation_tree, ['9', '-', '4', '-', '2']) == 3
+
+    q = p.parse(p.str_to_tokens('n ^ n ^ n'))
+
+    assert q.ok
+    assert g2.evaluate(q.derivation_tree, ['2', '^', '3', '^', '2']) == 512
+
+    q = p.parse(p.str_to_tokens('- n ^ n'))
+
+    assert q.ok
+    assert g2.evaluate(q.derivation_tree, ['-', '2', '^', '2']) == 4
+
+    q = p.evaluate(p.str_to_tokens('n - - n ^ n'), ['9', '-', '-', '2', '^', '2'])
+
+    assert q.ok
+    assert q.derivation_tree is None
+    assert q.value == 5
+
+    assert p.evaluate(p.str_to_tokens('n - -'), ['1', '-', '-']).error == 3
+
+    # the inherited attribute of L is the value of the n on its left
+    g3 = AttributedGrammar[int, str]()
+
+    g3.add_main("S")
+    g3.add_attributed_production("S", ["E"], [IdentityRule()])
+    g3.add_attributed_production("E", ["n L"], [
+        AttributedRule(lambda _, s: s[2], [(1, lambda _, s: int(s[1]))])])
+    g3.add_attributed_production("L", ["- n L", ""], [
+        AttributedRule(lambda _, s: s[3], [(2, lambda h, s: h[0] - int(s[2]))]),
+        AttributedRule(lambda h, _: h[0])])
+
+    assert AutomatonLALR1('test4_lalr1', g3).ok
+
+    table = TableLR(g3)
+    table.load('test4_lalr1')
+
+    p = Parser(g3, table)
+    tokens = p.str_to_tokens('n - n - n')
+    values = ['9', '-', '4', '-', '2']
+
+    assert p.evaluate(tokens, values).value == 3
+    assert g3.evaluate(p.parse(tokens).derivation_tree, values) == 3
+
+    # an inherited attribute passed down a chain far deeper than the
+    # recursion limit
+    tokens = p.str_to_tokens(' '.join(['n'] + ['-', 'n'] * 200000))
+    values = ['200000'] + ['-', '1'] * 200000
+
+    assert p.evaluate(tokens, values).value == 0
+    assert g3.evaluate(p.parse(tokens).derivation_tree, values) == 0
+
+    # an action on a terminal position is never run
+    calls = []
+    g5 = AttributedGrammar[int, str]()
+
+    g5.add_main("S")
+    g5.add_attributed_production("S", ["E"], [IdentityRule()])
+    g5.add_attributed_production("E", ["n"], [
+        AttributedRule(lambda _, s: int(s[1]), [(0, lambda h, s: calls.append(h))])])
+
+    assert AutomatonLALR1('test5_lalr1', g5).ok
+
+    table = TableLR(g5)
+    table.load('test5_lalr1')
+
+    p = Parser(g5, table)
+    tokens = p.str_to_tokens('n')
+
+    assert p.evaluate(tokens, ['4']).value == g5.evaluate(p.parse(tokens).derivation_tree, ['4']) == 4
+    assert calls == []
+
+    # an incremental parse gives the same values as a parse from scratch
+    table = TableLR(g2)
+    table.load('test3_lalr1')
+
+    p = Parser(g2, table)
+    ip = IncrementalParser(g2, table)
+    values = ['1', '-', '2', '^', '2', '-', '3', '-', '4']
+
+    assert ip.parse(p.str_to_tokens('n - n ^ n - n - n'), values).value == -10
+
+    edits = [(1, 2, '^', ['^']), (4, 5, 'n - n', ['1', '-', '5']), (0, 0, '- -', ['-', '-']), (0, 3, 'n', ['7'])]
+
+    for start, end, tokens, new in edits:
+        values[start:end] = new
+        q = ip.edit(start, end, p.str_to_tokens(tokens), new)
+
+        assert q.ok
+        assert q.value == p.evaluate(p.str_to_tokens(' '.join('n' if v.isdigit() else v for v in values)), values).value
+
+    assert ip.edit(1, 2, p.str_to_tokens('n'), ['3']).error == 1
+    assert ip.edit(1, 2, p.str_to_tokens('^'), ['^']).value == q.value
+
+    # several edits in a row, each checked against a parse from scratch
+    def fresh(values):
+        return p.evaluate(p.str_to_tokens(' '.join('n' if v.isdigit() else v for v in values)), values)
+
+    values = ['2', '^', '2', '^', '1', '-', '2']
+    ip.parse(p.str_to_tokens('n ^ n ^ n - n'), values)
+
+    for start, end, new in [(1, 2, ['^']), (5, 6, ['^'])]:
+        values[start:end] = new
+        q = ip.edit(start, end, p.str_to_tokens(' '.join(new)), new)
+
+    assert q.value == fresh(values).value == 2 ** 2 ** 1 ** 2
+
+    rnd = random.Random(0)
+
+    for _ in range(300):
+        values = [rnd.choice('12') if i % 2 == 0 else rnd.choice('-^') for i in range(9)]
+        ip.parse(p.str_to_tokens(' '.join('n' if v.isdigit() else v for v in values)), values)
+
+        for _ in range(4):
+            i = rnd.randrange(len(values))
+            new = [rnd.choice('12')] if values[i].isdigit() else [rnd.choice('-^')]
+            values[i:i + 1] = new
+            q = ip.edit(i, i + 1, p.str_to_tokens('n' if new[0].isdigit() else new[0]), new)
+
+            assert q.ok and q.value == fresh(values).value
@@ -1,5 +1,5 @@
 from compiler.automatonLR1 import AutomatonLR1
-from compiler.grammar import Grammar
+from compiler.grammar import Grammar, EOF
 
 
 def test():
@@ -25,3 +25,32 @@ def test():
 
     assert q.ok
     assert q1.ok
+
+    g2 = Grammar()
+
+    g2.add_main("S")
+    g2.add_production("S", ["X"])
+    g2.add_production("X", ["N b", "c"])
+    g2.add_production("N", ["a", ""])
+
+    q2 = AutomatonLR1('test3_lr1', g2)
+
+    assert q2.ok
+    assert EOF() not in g2.firsts[g2.get_token("X")]
+    assert len(q2.items) < sum(len(p.body) + 1 for p in g2.productions) * len(g2.terminals)
+
+    firsts, nullable = g2.get_suffix_first(g2.get_production(1), 0)
+    assert not nullable
+    assert set(map(str, g2.get_mask_tokens(firsts))) == {"a", "b"}
+    assert g2.get_suffix_first(g2.get_production(3), 0) == (g2.get_mask([g2.get_token("a")]), False)
+    assert g2.get_suffix_first(g2.get_production(4), 0) == (0, True)
+
+    assert EOF() is EOF()
+    assert g2.get_symbol(g2.get_token_id("b")) is g2.get_token("b")
+    assert g2.get_production(1).body[1] is g2.get_token("b")
+
+    q3 = AutomatonLR1('test1_lr1_par', g, workers=3)
+
+    assert q3.ok
+    assert [n.transitions for n in q3.nodes] == [n.transitions for n in q.nodes]
+    assert [n.items for n in q3.nodes] == [n.items for n in q.nodes]
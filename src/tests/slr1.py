@@ -1,3 +1,4 @@
+from compiler.automatonLR import partition
 from compiler.automatonSLR1 import AutomatonSLR1
 from compiler.grammar import Grammar
 
@@ -25,3 +26,26 @@ def test():
 
     assert q.ok
     assert not q1.ok
+
+    assert set(map(str, g.follows[g.get_token("F")])) == {"^", "*", "+", ")", "EOF"}
+    assert set(map(str, g.follows[g.get_token("E")])) == {")", "EOF"}
+
+    q2 = AutomatonSLR1('test1_slr1_par', g, workers=2)
+
+    assert q2.ok
+    assert [n.transitions for n in q2.nodes] == [n.transitions for n in q.nodes]
+
+    # tiny grammars: more workers than symbols, and no symbol but EOF to split
+    assert partition([], 2) == []
+    assert partition([1, 2, 3], 2) == [[1, 2], [3]]
+
+    g2 = Grammar()
+
+    g2.add_main("S")
+    g2.add_production("S", [""])
+
+    q3 = AutomatonSLR1('test_empty_slr1', g2)
+    q4 = AutomatonSLR1('test_empty_slr1_par', g2, workers=4)
+
+    assert q4.ok
+    assert [n.transitions for n in q4.nodes] == [n.transitions for n in q3.nodes]
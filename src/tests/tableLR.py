@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from compiler.parser import Parser
-from compiler.tableLR import TableLR
+from compiler.tableLR import TableLR, pack_rows
 from compiler.grammar import Grammar
+from compiler.attributed_grammar import AttributedGrammar, AttributedRule, IdentityRule
+from compiler.automatonSLR1 import AutomatonSLR1
 
 
 def test():
@@ -25,3 +29,169 @@ def test():
     assert q.ok
     assert not q1.ok
     assert q1.error == 1
+
+    assert q.derivation_tree.children[0].father is None
+    tree = p.parse(p.str_to_tokens('n ^ n * ( n + n )'), parents=True).derivation_tree
+    assert tree.children[0].father is tree
+
+    tokens = p.str_to_tokens('( n + n ) * n')
+    assert p.parse(tokens).ok
+    assert len(tokens) == 7
+
+    assert p.parse_ids([g.get_token_id(t) for t in 'n * n'.split(' ')]).ok
+    assert p.parse_ids([g.get_token_id(t) for t in 'n * +'.split(' ')]).error == 2
+
+    push = p.push()
+    reduced = [push.feed(t) for t in p.str_to_tokens('n ^ n * ( n + n )')]
+    q2 = push.finish()
+
+    assert q2.ok
+    assert [str(r).strip() for r in reduced[0]] == ['G -> n', 'F -> G']
+    assert reduced[1] == []
+    assert q2.derivation_tree.production_ind == q.derivation_tree.production_ind
+    assert len(push.reductions) == sum(len(r) for r in reduced) + 3
+
+    push = p.push()
+    push.feed(g.get_token('n'))
+    push.feed(g.get_token('n'))
+
+    assert not push.ok
+    assert push.feed(g.get_token('n')) == []
+    assert push.finish().error == 1
+
+    # one table shared by concurrent parses
+    programs = ['n ^ n * ( n + n )', 'n n', '( n ) + n * n', 'n + ( n', 'n']
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda s: p.parse(p.str_to_tokens(s)).ok, programs * 20))
+
+    assert results == [True, False, True, False, True] * 20
+
+    # a shared table is built and loaded once, whatever the thread asking
+    builds = []
+
+    def build():
+        builds.append(1)
+        return True
+
+    with ThreadPoolExecutor(4) as pool:
+        tables = list(pool.map(lambda _: TableLR.load_shared('test1_slr1', g, build), range(8)))
+
+    assert len(builds) == 1
+    assert all(t is tables[0] for t in tables)
+    assert Parser(g, tables[0]).parse(p.str_to_tokens('n * n')).ok
+
+    # rebuilding a table drops the shared copy of the previous file
+    AutomatonSLR1('test1_slr1', g)
+
+    assert 'test1_slr1' not in TableLR.shared
+    assert TableLR.load_shared('test1_slr1', g, build) is not tables[0]
+    assert len(builds) == 2
+
+    try:
+        TableLR.load_shared('test_conflicts', g, lambda: False)
+        assert False
+    except ValueError:
+        pass
+
+    rows = [{0: 5, 2: 7}, {1: 3}, {0: 5, 2: 7}, {}, {0: 1, 1: 2, 2: 4}]
+    base, check, values = pack_rows(rows, 3)
+
+    assert base[0] == base[2]
+
+    for r, row in enumerate(rows):
+        for c in range(3):
+            i = base[r] + c
+            assert (values[i] if check[i] == c else None) == row.get(c)
+
+    g1 = Grammar()
+
+    g1.add_main("S")
+    g1.add_production("S", ["n"])
+
+    try:
+        TableLR(g1).load('test1_slr1')
+        assert False
+    except ValueError:
+        pass
+
+    g2 = AttributedGrammar[int, str]()
+
+    g2.add_main("S")
+    g2.add_attributed_production("S", ["E"], [IdentityRule()])
+    g2.add_attributed_production("E", ["T + E", "T"], [
+        AttributedRule(lambda _, s: s[1] + s[3]), IdentityRule()])
+    g2.add_attributed_production("T", ["n"], [
+        AttributedRule(lambda _, s: int(s[1]))])
+
+    assert g2.is_transparent(g2.productions[2])
+    assert not g2.is_transparent(g2.productions[1])
+
+    AutomatonSLR1('test_unit_slr1', g2)
+
+    table = TableLR(g2)
+    table.load('test_unit_slr1')
+
+    p = Parser(g2, table)
+    q = p.parse(p.str_to_tokens('n + n + n'))
+    tokens = ['1', '+', '2', '+', '3']
+
+    assert q.ok
+    assert g2.evaluate(q.derivation_tree, tokens) == 6
+    assert q.derivation_tree.children[0].token.value == 'T'
+
+    assert AutomatonSLR1.is_up_to_date('test_unit_slr1', g2)
+    assert TableLR.get_fingerprint('test_unit_slr1') == AutomatonSLR1.get_fingerprint(g2)
+    assert TableLR.get_fingerprint('missing') is None
+
+    g2.add_attributed_production("T", ["( E )"], [
+        AttributedRule(lambda _, s: s[2])])
+
+    assert not AutomatonSLR1.is_up_to_date('test_unit_slr1', g2)
+
+    # a right recursive list much deeper than the recursion limit
+    tokens = ['1'] + ['+', '1'] * 100000
+    q = p.parse([g2.get_token('n' if t == '1' else t) for t in tokens])
+
+    assert g2.evaluate(q.derivation_tree, tokens) == 100001
+
+    # a pure unit chain: evaluating skips the unit states, trees keep them
+    g3 = AttributedGrammar[int, str]()
+
+    g3.add_main("S")
+    g3.add_attributed_production("S", ["A"], [IdentityRule()])
+    g3.add_attributed_production("A", ["B"], [IdentityRule()])
+    g3.add_attributed_production("B", ["n"], [AttributedRule(lambda _, s: int(s[1]))])
+
+    assert g3.is_transparent(g3.productions[1])
+
+    AutomatonSLR1('test_chain_slr1', g3)
+
+    table = TableLR(g3)
+    table.load('test_chain_slr1')
+
+    b, a = g3.get_token('B').id, g3.get_token('A').id
+
+    assert table.get_goto(0, b) != table.get_goto_bypass(0, b)
+    assert table.get_goto_bypass(0, b) == table.get_goto(0, a)
+
+    p = Parser(g3, table)
+    tokens = p.str_to_tokens('n')
+    tree = p.parse(tokens).derivation_tree
+
+    # the main production is accepted, not reduced, so the tree starts at A
+    assert [str(g3.productions[t.production_ind]).strip()
+            for t in (tree, tree.children[0])] == ['A -> B', 'B -> n']
+    assert p.evaluate(tokens, ['7']).value == g3.evaluate(tree, ['7']) == 7
+
+    # a unit production is not skipped when its child inherits an attribute
+    g4 = AttributedGrammar[int, str]()
+
+    g4.add_main("S")
+    g4.add_attributed_production("S", ["A", "n B"], [
+        IdentityRule(), AttributedRule(lambda _, s: s[2], [(1, lambda _, s: int(s[1]))])])
+    g4.add_attributed_production("A", ["B"], [IdentityRule()])
+    g4.add_attributed_production("B", [""], [AttributedRule(lambda h, _: h[0])])
+
+    assert g4.get_token('A') not in g4.get_inherited()
+    assert not g4.is_transparent(g4.productions[2])
@@ -1,4 +1,10 @@
+import gc
+import random
+
 from hulk.interpreter import compiler
+from hulk.semanticCore import Attribute, Class, Protocol, Method, SemanticError, Type, TypeHierarchy
+from hulk.defined import NUMBER, OBJECT, STRING
+from compiler.lexer import LexerToken
 
 
 def test():
@@ -183,4 +189,91 @@ def test():
         """
     
     assert not compiler(incorrect_extends)
-    
\ No newline at end of file
+    
+    a, b = Class('A'), Class('B')
+    b.set_parent(a)
+    a.define_method(LexerToken(0, 0, 'f', ''), [], NUMBER)
+
+    assert b.get_method('f') is a.get_method('f')
+    assert [t.name for _, t in b.all_methods()] == ['A']
+
+    # members added to an ancestor show up in the cached tables of subtypes
+    a.add_method(Method('g', NUMBER, []))
+    b.add_method(Method('f', OBJECT, []))
+
+    assert [(m.name, t.name) for m, t in b.all_methods()] == [('f', 'B'), ('g', 'A')]
+    assert b.get_method('f').return_type == OBJECT
+
+    try:
+        b.get_attribute(LexerToken(0, 0, 'x', ''))
+        assert False
+    except SemanticError:
+        pass
+
+    a.define_attribute(LexerToken(0, 0, 'x', ''), NUMBER)
+    assert b.get_attribute(LexerToken(0, 0, 'x', '')).type == NUMBER
+
+    # the frozen index agrees with walking the parents
+    rnd = random.Random(0)
+    protocols = [Protocol(f'P{i}') for i in range(4)]
+    protocols[1].set_parent(protocols[0])
+    classes = [Class(f'C{i}') for i in range(40)]
+    for i, c in enumerate(classes[1:], 1):
+        if i != 20:
+            c.set_parent(classes[rnd.randrange(i)])
+        for p in rnd.sample(protocols, rnd.randrange(3)):
+            c.add_protocol(p)
+
+    types = classes + protocols
+    hierarchy = TypeHierarchy(types)
+
+    for t1 in types:
+        for t2 in types:
+            assert hierarchy.conforms(t1, t2) == t1.conforms_to(t2)
+            assert hierarchy.low_common_ancestor(t1, t2) is Type.low_common_ancestor(t1, t2)
+
+    assert hierarchy.conforms(Class('new'), Class('new'))
+    assert hierarchy.low_common_ancestor(None, classes[3]) is classes[3]
+
+    hashable, sized = Protocol('Hashable'), Protocol('Sized')
+    hashable.add_method(Method('hash', NUMBER, [Attribute('a1', OBJECT)]))
+    sized.add_method(Method('size', NUMBER, []))
+
+    base, child = Class('Base'), Class('Child')
+    child.set_parent(base)
+    base.add_method(Method('hash', NUMBER, [Attribute('a1', OBJECT)]))
+
+    assert child.implement_protocol(hashable)
+    assert not child.implement_protocol(sized)
+
+    # arity is part of the signature and the most derived method wins
+    child.add_method(Method('hash', NUMBER, []))
+    assert child.get_method_signature('hash', 0) is not None
+    assert child.get_method_signature('hash', 1) is None
+    assert not child.implement_protocol(hashable)
+    assert base.implement_protocol(hashable)
+
+    # builtins do not keep the types of earlier programs alive
+    gc.collect()
+    count = len(OBJECT._subtypes)
+    temp = Class('Temp')
+    temp.set_parent(OBJECT)
+
+    assert len(OBJECT._subtypes) == count + 1
+
+    del temp
+    gc.collect()
+
+    assert len(OBJECT._subtypes) == count
+
+    temp = Class('Temp')
+    temp.set_parent(OBJECT)
+    temp.add_method(Method('toString', STRING, []))
+    temp.check_overriding()
+    temp.add_method(Method('eq', NUMBER, [Attribute('a1', OBJECT)]))
+
+    try:
+        temp.check_overriding()
+        assert False
+    except SemanticError:
+        pass
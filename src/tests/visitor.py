@@ -0,0 +1,50 @@
+from compiler import visitor
+
+
+class Base:
+    pass
+
+
+class Middle(Base):
+    pass
+
+
+class Leaf(Middle):
+    pass
+
+
+class Other:
+    pass
+
+
+class Namer(object):
+    @visitor.on('node')
+    def visit(self, node):
+        pass
+
+    @visitor.when(Base)
+    def visit(self, node):
+        return 'base'
+
+    @visitor.when(Middle)
+    def visit(self, node):
+        return 'middle'
+
+
+def test():
+    namer = Namer()
+
+    # a class without a target of its own takes the closest one in its MRO
+    assert namer.visit(Base()) == 'base'
+    assert namer.visit(Leaf()) == 'middle'
+
+    # nothing in the MRO has a target
+    assert namer.visit(Other()) == []
+
+    # a target added after a lookup replaces the cached resolution
+    dispatcher = Namer.visit.dispatcher
+    dispatcher.add_target(Leaf, lambda self, node: 'leaf')
+
+    assert Leaf in dispatcher.targets
+    assert namer.visit(Leaf()) == 'leaf'
+    assert namer.visit(Middle()) == 'middle'